@@ -176,22 +176,27 @@ def build_tree_from_dataframe(
 
     nodes: Dict[str, Node] = {}
 
-    # 1) Create nodes for every row (acronyms)
-    for _, row in df.iterrows():
-        acronym = _clean_str(row[cols["acronym"]])
+    # 1) Create nodes for every row (acronyms); plain tuples indexed by position
+    col_idx = {key: df.columns.get_loc(col) for key, col in cols.items()}
+    i_acronym, i_type, i_name = col_idx["acronym"], col_idx["type"], col_idx["name"]
+    i_parent, i_level = col_idx["parent"], col_idx["level"]
+    i_age_from, i_age_to = col_idx["age_from"], col_idx["age_to"]
+
+    for row in df.itertuples(index=False, name=None):
+        acronym = _clean_str(row[i_acronym])
 
         if not acronym:
             continue
-        type = _clean_str(row[cols["type"]])
+        type = _clean_str(row[i_type])
 
         if type != "CH":
             continue
 
-        name = _clean_str(row[cols["name"]])
-        parent = _clean_str(row[cols["parent"]])
-        level = _to_int(row[cols["level"]])
-        age_from = _to_float(row[cols["age_from"]])
-        age_to = _to_float(row[cols["age_to"]])
+        name = _clean_str(row[i_name])
+        parent = _clean_str(row[i_parent])
+        level = _to_int(row[i_level])
+        age_from = _to_float(row[i_age_from])
+        age_to = _to_float(row[i_age_to])
 
 
         # create or update
@@ -29,8 +29,11 @@ Implements all requested rules:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import math
+import os
+import pickle
 import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
@@ -55,6 +58,9 @@ DEFAULT_COLS = {
     "verboten": "VERBOTEN",
 }
 
+# everything str.isalpha() would reject (digits, "_", punctuation, whitespace)
+_NON_LETTERS = re.compile(r"[\W\d_]+")
+
 LEVEL_TO_RANK_DEFAULT = {
     0: "Eothem_L0",
     1: "Era_L1",
@@ -76,16 +82,53 @@ DEFAULT_SCHICHT_COL_TOPF = 6         # Column F
 # IO Helpers
 # -----------------------------
 
+@functools.lru_cache(maxsize=4)
+def _cached_read_excel(path: str, mtime: float, sheet: Optional[str], as_str: bool) -> pd.DataFrame:
+    # mtime is only part of the key: an edited workbook is parsed again
+    engine = "openpyxl" if path.lower().endswith(".xlsx") else None
+    return pd.read_excel(
+        path,
+        sheet_name=sheet if sheet is not None else 0,
+        engine=engine,
+        dtype=str if as_str else None,
+    )
+
+
+def read_excel_cached(path: str, sheet: Optional[str] = None, as_str: bool = False) -> pd.DataFrame:
+    """
+    pd.read_excel with the parsed sheet kept in memory for repeated runs
+    (e.g. from the GUI). Returns a copy, callers may modify it.
+    as_str=True skips pandas' dtype inference (cells come back as str / NaN).
+    """
+    path = os.path.abspath(path)
+    return _cached_read_excel(path, os.path.getmtime(path), sheet, as_str).copy()
+
+
+def _read_excel_table(path: str, sheet: Optional[str]) -> pd.DataFrame:
+    # every ATS column is cleaned / converted explicitly in build_from_dataframe
+    return read_excel_cached(path, sheet=sheet, as_str=True)
+
+
+def _read_csv_table(path: str, sheet: Optional[str]) -> pd.DataFrame:
+    try:
+        return pd.read_csv(path)
+    except Exception:
+        return pd.read_csv(path, sep=";")
+
+
+# file extension (lower case) -> reader(path, sheet)
+_TABLE_READERS = {
+    ".xlsx": _read_excel_table,
+    ".xls": _read_excel_table,
+    ".csv": _read_csv_table,
+}
+
+
 def read_table(path: str, sheet: Optional[str] = None) -> pd.DataFrame:
-    lower = path.lower()
-    if lower.endswith((".xlsx", ".xls")):
-        return pd.read_excel(path, sheet_name=sheet if sheet is not None else 0)
-    if lower.endswith(".csv"):
-        try:
-            return pd.read_csv(path)
-        except Exception:
-            return pd.read_csv(path, sep=";")
-    raise ValueError("Unsupported file type. Use .xlsx/.xls/.csv")
+    reader = _TABLE_READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError("Unsupported file type. Use .xlsx/.xls/.csv")
+    return reader(path, sheet)
 
 
 # -----------------------------
@@ -101,7 +144,7 @@ class Node:
     age_from: Optional[float] = None
     age_to: Optional[float] = None
     rank: str = "unknown"
-    region: Optional[set[str]] = None
+    region: Optional[frozenset[str]] = None
     strat_type: Optional[str] = None
     verboten: bool = False
     members: List[str] = field(default_factory=list)
@@ -154,14 +197,37 @@ class StratigraphyModel:
         self.fault_regex = re.compile(fault_regex, re.IGNORECASE)
 
         self.tree: Optional[Dict[str, Any]] = None
+        self.roots: Optional[List[str]] = None  # set once the model is indexed
         self.index: Dict[str, Dict[str, Any]] = {}
         self.parent_of: Dict[str, Optional[str]] = {}
-        self.siblings_by_parent: Dict[str, List[str]] = {}
+        self._children_raw: Dict[str, List[str]] = {}
+        self.siblings_by_parent: Dict[str, List[str]] = {}  # filled lazily by _sibs()
+        self.sibling_pos: Dict[str, int] = {}
+        self._sort_keys: Dict[str, Tuple[int, float, str]] = {}
+
+        # per-unit attributes parsed once in _index_tree (keyed by acronym)
+        self.region_of: Dict[str, Optional[frozenset[str]]] = {}
+        self.strat_type_of: Dict[str, Optional[str]] = {}
+        self.level_of: Dict[str, Optional[int]] = {}
+        self.age_from_of: Dict[str, Optional[float]] = {}
+        self.age_to_of: Dict[str, Optional[float]] = {}
+        self.region_bits_of: Dict[str, int] = {}  # region letters as a bitmask, 0 = unknown
+
+        # column (SoA) view of the units: unit_codes[i] <-> unit_id[code], codes in sorted order
+        self.unit_codes: List[str] = []
+        self.unit_id: Dict[str, int] = {}
+        self.age_to_arr: np.ndarray = np.empty(0, dtype=float)
+
+        # find_equivalent_top_for_base_code results, valid until the next _index_tree
+        self._equiv_cache: Dict[Tuple[str, bool, Optional[str]], Tuple[bool, Optional[str], Optional[str], str]] = {}
 
     # ---------- parsing helpers ----------
 
     @staticmethod
     def _clean_str(x: Any) -> Optional[str]:
+        if type(x) is str:
+            s = x.strip()
+            return s if s else None
         if x is None:
             return None
         if isinstance(x, float) and math.isnan(x):
@@ -171,6 +237,8 @@ class StratigraphyModel:
 
     @staticmethod
     def _to_int(x: Any) -> Optional[int]:
+        if type(x) is int:
+            return x
         try:
             if x is None or (isinstance(x, float) and math.isnan(x)):
                 return None
@@ -180,11 +248,12 @@ class StratigraphyModel:
 
     @staticmethod
     def _to_float(x: Any) -> Optional[float]:
+        # numeric cells need no string round trip
+        if isinstance(x, (int, float)) and not isinstance(x, bool):
+            return None if x != x else float(x)
         try:
             if x is None:
                 return None
-            if isinstance(x, float) and math.isnan(x):
-                return None
             s = str(x).strip().replace(",", ".")
             if not s:
                 return None
@@ -192,24 +261,46 @@ class StratigraphyModel:
         except Exception:
             return None
 
+    # column-wise versions of the helpers above (same results, one pass per column)
+
+    @staticmethod
+    def _clean_str_col(col: pd.Series) -> List[Optional[str]]:
+        strs = col.astype(str).str.strip()
+        keep = (col.notna() & (strs != "")).to_numpy(dtype=bool)
+        # object dtype so blanks come back as None, not NaN (pandas' str dtype keeps NaN)
+        return strs.astype(object).where(keep, None).tolist()
+
+    @staticmethod
+    def _to_float_col(col: pd.Series) -> List[Optional[float]]:
+        if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+            # already numeric (e.g. the sorted Schichten depth column): no string round trip
+            nums = col.to_numpy(dtype=float)
+        else:
+            strs = col.astype(str).str.strip().str.replace(",", ".", regex=False)
+            nums = pd.to_numeric(strs, errors="coerce").to_numpy(dtype=float)
+        return [None if v != v else v for v in nums.tolist()]
+
+    @staticmethod
+    def _to_int_col(col: pd.Series) -> List[Optional[int]]:
+        nums = pd.to_numeric(col.astype(str).str.strip(), errors="coerce").to_numpy(dtype=float)
+        return [int(v) if math.isfinite(v) else None for v in nums.tolist()]
+
     def _rank_from_level(self, level: Optional[int]) -> str:
         if level is None:
             return "unknown"
         return self.level_to_rank.get(level, f"level_{level}")
 
     @staticmethod
-    def _parse_regions(s: Any) -> Optional[set[str]]:
+    def _parse_regions(s: Any) -> Optional[frozenset[str]]:
         v = StratigraphyModel._clean_str(s)
         if not v:
             return None
-        return {ch for ch in v if ch.isalpha()}
+        return frozenset(_NON_LETTERS.sub("", v))
 
-    def _region_overlap(self, a: Optional[set[str]], b: Optional[set[str]]) -> bool:
-        if self.region_unknown_ok and (not a or not b):
-            return True
+    def _region_overlap(self, a: Optional[frozenset[str]], b: Optional[frozenset[str]]) -> bool:
         if not a or not b:
-            return False
-        return len(a.intersection(b)) > 0
+            return self.region_unknown_ok
+        return not a.isdisjoint(b)
 
     @staticmethod
     def _sort_key_age_from(node_dict: Dict[str, Any]) -> Tuple[int, float, str]:
@@ -220,11 +311,16 @@ class StratigraphyModel:
 
     # ---------- build / index ----------
 
-    def build_from_file(self, ats_path: str, sheet: Optional[str] = None) -> Dict[str, Any]:
+    def build_from_file(self, ats_path: str, sheet: Optional[str] = None, as_tree: bool = True) -> Optional[Dict[str, Any]]:
         df = read_table(ats_path, sheet=sheet)
-        return self.build_from_dataframe(df)
+        return self.build_from_dataframe(df, as_tree=as_tree)
 
-    def build_from_dataframe(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def build_from_dataframe(self, df: pd.DataFrame, as_tree: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Build and index the ATS catalogue. The nested JSON tree is only
+        assembled if as_tree is set (or later via to_json_tree); the
+        analysis itself works from the flat index.
+        """
         df = df.copy()
         df.columns = [str(c).strip() for c in df.columns]
         c = self.cols
@@ -236,28 +332,39 @@ class StratigraphyModel:
 
         nodes: Dict[str, Node] = {}
 
-        for _, row in df.iterrows():
-            acronym = self._clean_str(row[c["acronym"]])
+        # parse column-wise once, then build nodes from plain per-row values
+        n_rows = len(df)
+        acronyms = self._clean_str_col(df[c["acronym"]])
+        names = self._clean_str_col(df[c["name"]])
+        parents = self._clean_str_col(df[c["parent"]])
+        levels = self._to_int_col(df[c["level"]])
+        ages_from = self._to_float_col(df[c["age_from"]])
+        ages_to = self._to_float_col(df[c["age_to"]])
+        if c.get("verboten") in df.columns:
+            verbotens = [v == "*" for v in self._clean_str_col(df[c["verboten"]])]
+        else:
+            verbotens = [False] * n_rows
+        if c.get("region") in df.columns:
+            regions = [self._parse_regions(v) for v in self._clean_str_col(df[c["region"]])]
+        else:
+            regions = [None] * n_rows
+        if c.get("strat_type") in df.columns:
+            strat_types = self._clean_str_col(df[c["strat_type"]])
+        else:
+            strat_types = [None] * n_rows
+
+        for acronym, name, parent_raw, level, age_from, age_to, verboten, region, strat_type in zip(
+            acronyms, names, parents, levels, ages_from, ages_to, verbotens, regions, strat_types
+        ):
             if not acronym:
                 continue
 
-            name = self._clean_str(row[c["name"]])
-            parent_raw = self._clean_str(row[c["parent"]])
             # Normalize "no parent" markers to None
             parent = None if parent_raw in (None, "", "-") else parent_raw
 
-            level = self._to_int(row[c["level"]])
-            age_from = self._to_float(row[c["age_from"]])
-            age_to = self._to_float(row[c["age_to"]])
-
-            verboten_val = self._clean_str(row.get(c.get("verboten")))
-            verboten = (verboten_val == "*")
-
-            region = self._parse_regions(row[c["region"]]) if c.get("region") in df.columns else None
-            strat_type = self._clean_str(row[c["strat_type"]]) if c.get("strat_type") in df.columns else None
-
-            n = nodes.get(acronym) or Node(acronym=acronym)
-            nodes[acronym] = n
+            n = nodes.get(acronym)
+            if n is None:
+                n = nodes[acronym] = Node(acronym=acronym)
 
             n.name = name if name is not None else n.name
             n.parent = parent
@@ -270,24 +377,131 @@ class StratigraphyModel:
             n.region = region if region is not None else n.region
             n.strat_type = strat_type if strat_type is not None else n.strat_type
 
-        # stubs for referenced parents
-        for n in list(nodes.values()):
-            if n.parent and n.parent not in nodes:
-                nodes[n.parent] = Node(acronym=n.parent, parent=None, rank="unknown")
+        # stubs for referenced parents (created in one batch, first-reference order)
+        referenced = dict.fromkeys(n.parent for n in nodes.values() if n.parent)
+        for p in [p for p in referenced if p not in nodes]:
+            nodes[p] = Node(acronym=p, parent=None, rank="unknown")
 
-        # adjacency
+        # adjacency (every referenced parent exists by now)
         for n in nodes.values():
-            if n.parent and n.parent in nodes:
+            if n.parent:
                 nodes[n.parent].members.append(n.acronym)
 
-        roots = [n for n in nodes.values() if not n.parent]
-        root_dicts = [r.to_dict(nodes, self._sort_key_age_from) for r in roots]
-        root_dicts.sort(key=self._sort_key_age_from)
+        roots = [n.acronym for n in nodes.values() if not n.parent]
+
+        # flat unit dicts + age sort keys for everything reachable from a root
+        index: Dict[str, Dict[str, Any]] = {}
+        sort_keys: Dict[str, Tuple[int, float, str]] = {}
+        inf = float("inf")
+        parent_of: Dict[str, Optional[str]] = {}
+        children: Dict[str, List[str]] = {}
+        stack: List[str] = list(roots)
+        for r in roots:
+            parent_of[r] = None
+        while stack:
+            acr = stack.pop()
+            n = nodes[acr]
+            index[acr] = {
+                "acronym": n.acronym,
+                "name": n.name,
+                "parent": n.parent,  # IMPORTANT (needed for candidate exclusion)
+                "rank": n.rank,
+                "level": n.level,
+                "region": "".join(sorted(n.region)) if n.region else None,
+                "strat_type": n.strat_type,
+                "verboten": n.verboten,
+                "age_ma": {"from": n.age_from, "to": n.age_to},
+            }
+            # same tuple as _sort_key_age_from, straight from the Node
+            sort_keys[acr] = (1, inf, acr) if n.age_from is None else (0, n.age_from, acr)
+            if n.members:
+                children[acr] = n.members
+                for k in n.members:
+                    parent_of[k] = acr
+                stack.extend(n.members)
+
+        self.tree = None
+        self._index_units(index, parent_of, children, roots, sort_roots=True, sort_keys=sort_keys)
+        return self.to_json_tree() if as_tree else None
+
+    def to_json_tree(self) -> Dict[str, Any]:
+        """
+        Nested {"stratigraphy": [...]} tree (members youngest -> oldest) for
+        JSON export, built from the index on first use.
+        """
+        if self.tree is not None:
+            return self.tree
+        if self.roots is None:
+            raise RuntimeError("Tree not built yet.")
+
+        # children before parents, with an explicit stack (no recursion limit on deep trees)
+        nested: Dict[str, Dict[str, Any]] = {}
+        stack: List[Tuple[str, bool]] = [(r, False) for r in self.roots]
+        while stack:
+            acr, children_done = stack.pop()
+            kids = self._sibs(acr)
+            if kids and not children_done:
+                stack.append((acr, True))
+                stack.extend((k, False) for k in kids)
+                continue
+            d = dict(self.index[acr])
+            if kids:
+                d["members"] = [nested[k] for k in kids]
+            nested[acr] = d
 
-        self.tree = {"stratigraphy": root_dicts}
-        self._index_tree()
+        self.tree = {"stratigraphy": [nested[r] for r in self.roots]}
         return self.tree
 
+    # ---------- built-tree cache ----------
+
+    # everything _index_tree derives from the ATS catalogue; bump _CACHE_FORMAT when this changes
+    _CACHE_FORMAT = 4
+    _CACHED_FIELDS = (
+        "tree", "roots", "index", "parent_of", "_children_raw", "siblings_by_parent", "sibling_pos", "_sort_keys",
+        "region_of", "strat_type_of", "level_of", "age_from_of", "age_to_of",
+        "region_bits_of", "unit_codes", "unit_id", "age_to_arr",
+    )
+
+    def save_cache(self, path: str, ats_path: str, sheet: Optional[str] = None) -> None:
+        """Pickle the built tree + lookup maps, tagged with the ATS file's mtime, sheet and column mapping."""
+        if self.roots is None:
+            raise RuntimeError("Tree not built yet.")
+        payload = {
+            "format": self._CACHE_FORMAT,
+            "ats_mtime": os.path.getmtime(ats_path),
+            "sheet": sheet,
+            "cols": dict(self.cols),
+            "level_to_rank": dict(self.level_to_rank),
+            "fields": {name: getattr(self, name) for name in self._CACHED_FIELDS},
+        }
+        with open(path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_cache(self, path: str, ats_path: str, sheet: Optional[str] = None) -> bool:
+        """
+        Restore a tree saved by save_cache. Returns False (model untouched) if the
+        cache is missing, unreadable or was built from a different ATS file state.
+        """
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+            ok = (
+                payload.get("format") == self._CACHE_FORMAT
+                and payload.get("ats_mtime") == os.path.getmtime(ats_path)
+                and payload.get("sheet") == sheet
+                and payload.get("cols") == dict(self.cols)
+                and payload.get("level_to_rank") == dict(self.level_to_rank)
+            )
+        except Exception:
+            return False
+        if not ok:
+            return False
+
+        for name, value in payload["fields"].items():
+            setattr(self, name, value)
+        self._equiv_cache = {}
+        return True
+
     def _index_tree(self) -> None:
         if not self.tree:
             raise RuntimeError("Tree not built yet.")
@@ -312,33 +526,95 @@ class StratigraphyModel:
                         children_tmp[acr].append(ch_acr)
                     walk(ch, acr)
 
+        roots: List[str] = []
         for r in self.tree.get("stratigraphy", []) or []:
             walk(r, None)
+            if r.get("acronym"):
+                roots.append(r["acronym"])
 
-        siblings_by_parent: Dict[str, List[str]] = {}
-        for p, kids in children_tmp.items():
-            siblings_by_parent[p] = sorted(
-                kids,
-                key=lambda a: self._sort_key_age_from(index.get(a, {"acronym": a, "age_ma": {"from": None}}))
-            )
+        self._index_units(index, parent_of, children_tmp, roots)
 
+    def _index_units(
+        self,
+        index: Dict[str, Dict[str, Any]],
+        parent_of: Dict[str, Optional[str]],
+        children_tmp: Dict[str, List[str]],
+        roots: List[str],
+        sort_roots: bool = False,
+        sort_keys: Optional[Dict[str, Tuple[int, float, str]]] = None,
+    ) -> None:
+        """Derive the sibling order and per-unit lookup maps from flat unit dicts."""
+        self._equiv_cache = {}
+
+        # one age sort key per unit, shared by the root and all sibling sorts
+        if sort_keys is None:
+            sort_keys = {acr: self._sort_key_age_from(node) for acr, node in index.items()}
+
+        region_of: Dict[str, Optional[frozenset[str]]] = {}
+        strat_type_of: Dict[str, Optional[str]] = {}
+        level_of: Dict[str, Optional[int]] = {}
+        age_from_of: Dict[str, Optional[float]] = {}
+        age_to_of: Dict[str, Optional[float]] = {}
+        for acr, node in index.items():
+            region_of[acr] = self._parse_regions(node.get("region"))
+            strat_type_of[acr] = self._clean_str(node.get("strat_type"))
+            try:
+                lvl = node.get("level")
+                level_of[acr] = int(lvl) if lvl is not None else None
+            except Exception:
+                level_of[acr] = None
+            ages = node.get("age_ma") or {}
+            af, at = ages.get("from"), ages.get("to")
+            age_from_of[acr] = float(af) if af is not None else None
+            age_to_of[acr] = float(at) if at is not None else None
+
+        # one bit per region letter -> overlap test is a single "&"
+        letter_bit: Dict[str, int] = {}
+        region_bits_of: Dict[str, int] = {}
+        for acr, regs in region_of.items():
+            bits = 0
+            for ch in regs or ():
+                bits |= letter_bit.setdefault(ch, 1 << len(letter_bit))
+            region_bits_of[acr] = bits
+
+        unit_codes = sorted(index)
+        self.unit_codes = unit_codes
+        self.unit_id = {acr: i for i, acr in enumerate(unit_codes)}
+        self.age_to_arr = np.array(
+            [np.nan if age_to_of[acr] is None else age_to_of[acr] for acr in unit_codes], dtype=float
+        )
+
+        self._sort_keys = sort_keys
+        self.region_bits_of = region_bits_of
+        self.region_of = region_of
+        self.strat_type_of = strat_type_of
+        self.level_of = level_of
+        self.age_from_of = age_from_of
+        self.age_to_of = age_to_of
         self.index = index
         self.parent_of = parent_of
-        self.siblings_by_parent = siblings_by_parent
+        # sibling lists are sorted on first use (_sibs); most runs touch few parents
+        self._children_raw = children_tmp
+        self.siblings_by_parent = {}
+        self.sibling_pos = {}
+        self.roots = sorted(roots, key=sort_keys.__getitem__) if sort_roots else list(roots)
 
     # ---------- node attribute helpers ----------
 
-    def _node_regions(self, node: Optional[Dict[str, Any]]) -> Optional[set[str]]:
+    def _node_regions(self, node: Optional[Dict[str, Any]]) -> Optional[frozenset[str]]:
         if not node:
             return None
-        s = node.get("region")
-        if not s:
-            return None
-        return {ch for ch in str(s) if ch.isalpha()}
+        acr = node.get("acronym")
+        if acr in self.region_of:
+            return self.region_of[acr]
+        return self._parse_regions(node.get("region"))
 
     def _node_strat_type(self, node: Optional[Dict[str, Any]]) -> Optional[str]:
         if not node:
             return None
+        acr = node.get("acronym")
+        if acr in self.strat_type_of:
+            return self.strat_type_of[acr]
         return self._clean_str(node.get("strat_type"))
 
     def _is_valid_for_selected_region(self, node: Dict[str, Any]) -> bool:
@@ -389,6 +665,78 @@ class StratigraphyModel:
         if cand_node.get("verboten") is True:
             return False
 
+        base_code = base_node.get("acronym")
+        cand_code = cand_node.get("acronym")
+        if base_code not in self.level_of or cand_code not in self.level_of:
+            # node from outside the indexed tree -> parse its attributes on the fly
+            return self._candidate_ok_unindexed(base_node, cand_node, require_same_strat_type, above_fault)
+
+        # NEW RULE: candidate must not be younger than base (by Alter von)
+        base_from = self.age_from_of[base_code]
+        cand_from = self.age_from_of[cand_code]
+        if base_from is not None and cand_from is not None:
+            # younger => smaller Ma; reject if candidate starts younger than base
+            if cand_from < base_from:
+                return False
+
+        # NEW RULE: reject candidates with the same "Alter bis" (age_ma.to) as the base unit
+        base_to = self.age_to_of[base_code]
+        cand_to = self.age_to_of[cand_code]
+        if base_to is not None and cand_to is not None:
+            if cand_to == base_to:
+                return False
+
+        # NEW RULE: If base_code contains ".", candidate must also contain "."
+        if base_code and "." in base_code:
+            if not cand_code or "," in cand_code:
+                return False
+
+        # Reject candidates with no parent (Vater == "-" / None / "")
+        cand_parent = cand_node.get("parent")
+        if cand_parent is None or str(cand_parent).strip() in ("", "-"):
+            return False
+
+        # Strict region restriction
+        cand_regions = self.region_of[cand_code]
+        if self.strict_region_filter and self.selected_region:
+            if not cand_regions or self.selected_region not in cand_regions:
+                return False
+
+        base_level = self.level_of[base_code]
+
+        # Same-level restriction down to level N (except above_fault)
+        if not above_fault and base_level is not None and base_level <= self.same_level_upto:
+            cand_level = self.level_of[cand_code]
+            if cand_level is None or cand_level != base_level:
+                return False
+
+        # Force CH down to level N
+        if base_level is not None and base_level <= self.force_ch_upto_level:
+            if self.strat_type_of[cand_code] != "CH":
+                return False
+
+        # Region overlap preference
+        base_bits = self.region_bits_of[base_code]
+        cand_bits = self.region_bits_of[cand_code]
+        if base_bits and cand_bits:
+            if not base_bits & cand_bits:
+                return False
+        elif not self.region_unknown_ok:
+            return False
+
+        # Strat type preference
+        if require_same_strat_type:
+            return self.strat_type_of[base_code] == self.strat_type_of[cand_code]
+
+        return True
+
+    def _candidate_ok_unindexed(
+        self,
+        base_node: Dict[str, Any],
+        cand_node: Dict[str, Any],
+        require_same_strat_type: bool,
+        above_fault: bool,
+    ) -> bool:
         # NEW RULE: candidate must not be younger than base (by Alter von)
         base_from = (base_node.get("age_ma") or {}).get("from")
         cand_from = (cand_node.get("age_ma") or {}).get("from")
@@ -404,7 +752,6 @@ class StratigraphyModel:
             if float(cand_to) == float(base_to):
                 return False
 
-
         # NEW RULE: If base_code contains ".", candidate must also contain "."
         base_code = base_node.get("acronym")
         cand_code = cand_node.get("acronym")
@@ -526,6 +873,23 @@ class StratigraphyModel:
     # =========================
 
 
+    def _sibs(self, parent: str) -> List[str]:
+        """Children of parent sorted youngest -> oldest, sorted and memoized on first request."""
+        sibs = self.siblings_by_parent.get(parent)
+        if sibs is None:
+            sibs = sorted(self._children_raw.get(parent, ()), key=self._sort_keys.__getitem__)
+            self.siblings_by_parent[parent] = sibs
+            for i, a in enumerate(sibs):
+                self.sibling_pos[a] = i
+        return sibs
+
+    def _position_in(self, code: str, siblings: List[str]) -> Optional[int]:
+        """Position of code in its sorted sibling list (O(1) via sibling_pos), None if not in siblings."""
+        i = self.sibling_pos.get(code)
+        if i is None or i >= len(siblings) or siblings[i] != code:
+            return None
+        return i
+
     def _pick_best_older_sibling_by_boundary(
         self,
         base_code: str,
@@ -540,35 +904,16 @@ class StratigraphyModel:
           pass1 same Strat_Typ
           pass2 relaxed Strat_Typ
         """
-        if base_code not in siblings:
+        i = self._position_in(base_code, siblings)
+        if i is None:
             return None
 
         base_from = self._base_boundary_from(base_node)
         if base_from is None:
             return None
 
-        i = siblings.index(base_code)
         older = siblings[i + 1 :]
-
-        def best(require_same: bool) -> Optional[str]:
-            scored: List[Tuple[float, str]] = []
-            for c in older:
-                cn = self.index.get(c)
-                if not cn:
-                    continue
-                if not self._candidate_ok(base_node, cn, require_same_strat_type=require_same, above_fault=above_fault):
-                    continue
-                cand_to = self._cand_boundary_to(cn)
-                if cand_to is None:
-                    continue
-                diff = abs(float(base_from) - float(cand_to))
-                scored.append((diff, c))
-            if not scored:
-                return None
-            scored.sort()
-            return scored[0][1]
-
-        return best(True) or best(False)
+        return self._best_by_boundary(older, base_node, base_from, above_fault)
 
     def _choose_best_child_by_boundary(
         self,
@@ -583,24 +928,37 @@ class StratigraphyModel:
         base_from = self._base_boundary_from(base_node)
         if base_from is None:
             return None
+        return self._best_by_boundary(children, base_node, base_from, above_fault)
+
+    def _best_by_boundary(
+        self,
+        candidates: List[str],
+        base_node: Dict[str, Any],
+        base_from: float,
+        above_fault: bool,
+    ) -> Optional[str]:
+        """
+        First candidate in (abs(base_from - candidate.age_to), code) order that
+        passes _candidate_ok; same-type pass first, then relaxed. The distances
+        are ranked in one go on the age_to column, so the (costlier) filter only
+        runs until the first hit. Candidates without an age_to are dropped.
+        """
+        unit_id = self.unit_id
+        ids = np.fromiter((unit_id[c] for c in candidates if c in unit_id), dtype=np.intp)
+        cand_to = self.age_to_arr[ids]
+        dated = ~np.isnan(cand_to)
+        if not dated.any():
+            return None
+        ids = ids[dated]
+        diffs = np.abs(base_from - cand_to[dated])
+        # ids follow the sorted acronyms, so this is (diff, code) order
+        ranked = [self.unit_codes[i] for i in ids[np.lexsort((ids, diffs))].tolist()]
 
         def best(require_same: bool) -> Optional[str]:
-            scored: List[Tuple[float, str]] = []
-            for c in children:
-                cn = self.index.get(c)
-                if not cn:
-                    continue
-                if not self._candidate_ok(base_node, cn, require_same_strat_type=require_same, above_fault=above_fault):
-                    continue
-                cand_to = self._cand_boundary_to(cn)
-                if cand_to is None:
-                    continue
-                diff = abs(float(base_from) - float(cand_to))
-                scored.append((diff, c))
-            if not scored:
-                return None
-            scored.sort()
-            return scored[0][1]
+            for c in ranked:
+                if self._candidate_ok(base_node, self.index[c], require_same_strat_type=require_same, above_fault=above_fault):
+                    return c
+            return None
 
         return best(True) or best(False)
 
@@ -611,7 +969,25 @@ class StratigraphyModel:
             above_fault: bool = False,
             preferred_candidate_code: Optional[str] = None,  # NEW
     ) -> Tuple[bool, Optional[str], Optional[str], str]:
+        """Memoized: the indexed tree does not change between _index_tree calls."""
+        key = (base_code, bool(above_fault), preferred_candidate_code)
+        try:
+            return self._equiv_cache[key]
+        except (KeyError, TypeError):
+            pass
+        result = self._find_equivalent_top(base_code, above_fault, preferred_candidate_code)
+        try:
+            self._equiv_cache[key] = result
+        except TypeError:
+            pass  # unhashable input, just don't cache it
+        return result
 
+    def _find_equivalent_top(
+            self,
+            base_code: str,
+            above_fault: bool,
+            preferred_candidate_code: Optional[str],
+    ) -> Tuple[bool, Optional[str], Optional[str], str]:
         base_code = self._clean_str(base_code) or ""
         if not base_code:
             return (False, None, None, "empty code")
@@ -637,8 +1013,8 @@ class StratigraphyModel:
         parent = self.parent_of.get(base_code)
 
         # 1) Older sibling under same parent (best-fit boundary)
-        if parent and parent in self.siblings_by_parent:
-            sibs = self.siblings_by_parent[parent]
+        if parent and parent in self._children_raw:
+            sibs = self._sibs(parent)
             chosen = self._pick_best_older_sibling_by_boundary(base_code, base_node, sibs, above_fault=above_fault)
             if chosen:
                 return (True, chosen, self.index.get(chosen, {}).get("name"), "ok_filtered_sibling_bestfit")
@@ -649,22 +1025,22 @@ class StratigraphyModel:
             return (True, fb, base_node.get("name"), "no_equivalent_found_using_base_BASE")
 
         grandparent = self.parent_of.get(parent)
-        if not grandparent or grandparent not in self.siblings_by_parent:
+        if not grandparent or grandparent not in self._children_raw:
             fb = f"{base_code},BASE"
             return (True, fb, base_node.get("name"), "no_equivalent_found_using_base_BASE")
 
-        parent_sibs = self.siblings_by_parent[grandparent]
-        if parent not in parent_sibs:
+        parent_sibs = self._sibs(grandparent)
+        pi = self._position_in(parent, parent_sibs)
+        if pi is None:
             fb = f"{base_code},BASE"
             return (True, fb, base_node.get("name"), "no_equivalent_found_using_base_BASE")
 
-        pi = parent_sibs.index(parent)
         if pi + 1 >= len(parent_sibs):
             fb = f"{base_code},BASE"
             return (True, fb, base_node.get("name"), "no_equivalent_found_using_base_BASE")
 
         older_parent_sib = parent_sibs[pi + 1]
-        children = self.siblings_by_parent.get(older_parent_sib, [])
+        children = self._sibs(older_parent_sib)
 
         if not children:
             cand = self.index.get(older_parent_sib)
@@ -704,8 +1080,8 @@ class StratigraphyModel:
         parent = self.parent_of.get(base_code)
 
         # 1) Older sibling under same parent
-        if parent and parent in self.siblings_by_parent:
-            sibs = self.siblings_by_parent[parent]
+        if parent and parent in self._children_raw:
+            sibs = self._sibs(parent)
             chosen = self._pick_best_older_sibling_by_boundary(base_code, base_node, sibs, above_fault=above_fault)
             if chosen:
                 return (True, chosen, self.index.get(chosen, {}).get("name"), "ok_filtered_sibling_bestfit")
@@ -716,22 +1092,22 @@ class StratigraphyModel:
             return (True, fb, base_node.get("name"), "no_equivalent_found_using_base_BASE")
 
         grandparent = self.parent_of.get(parent)
-        if not grandparent or grandparent not in self.siblings_by_parent:
+        if not grandparent or grandparent not in self._children_raw:
             fb = f"{base_code},BASE"
             return (True, fb, base_node.get("name"), "no_equivalent_found_using_base_BASE")
 
-        parent_sibs = self.siblings_by_parent[grandparent]
-        if parent not in parent_sibs:
+        parent_sibs = self._sibs(grandparent)
+        pi = self._position_in(parent, parent_sibs)
+        if pi is None:
             fb = f"{base_code},BASE"
             return (True, fb, base_node.get("name"), "no_equivalent_found_using_base_BASE")
 
-        pi = parent_sibs.index(parent)
         if pi + 1 >= len(parent_sibs):
             fb = f"{base_code},BASE"
             return (True, fb, base_node.get("name"), "no_equivalent_found_using_base_BASE")
 
         older_parent_sib = parent_sibs[pi + 1]
-        children = self.siblings_by_parent.get(older_parent_sib, [])
+        children = self._sibs(older_parent_sib)
 
         # 2a) If no children: try using the older parent sibling itself
         if not children:
@@ -763,11 +1139,11 @@ class StratigraphyModel:
         col_depth_1based: int = DEFAULT_SCHICHT_COL_DEPTH,        # C
         col_top_1based: int = DEFAULT_SCHICHT_COL_TOPF,           # F
     ) -> pd.DataFrame:
-        if not self.tree:
+        if self.roots is None:
             raise RuntimeError("Tree not built yet. Call build_from_file/build_from_dataframe first.")
 
         #df = pd.read_excel(schichten_xlsx_path, sheet_name=sheet if sheet is not None else 0)
-        df = pd.read_excel(schichten_xlsx_path, sheet_name=sheet if sheet is not None else 0, engine="openpyxl")
+        df = read_excel_cached(schichten_xlsx_path, sheet=sheet)
 
 
         idx_basecode = col_basecode_1based - 1
@@ -782,14 +1158,18 @@ class StratigraphyModel:
             df.iloc[:, idx_depth] = df["_depth_numeric"]
             df = df.drop(columns=["_depth_numeric"])
 
+        # ---- pull the three columns out once (no per-cell df.iloc) ----
+        n_rows = len(df)
+        n_cols = df.shape[1]
+        base_codes = self._clean_str_col(df.iloc[:, idx_basecode]) if idx_basecode < n_cols else [None] * n_rows
+        depths = self._to_float_col(df.iloc[:, idx_depth]) if idx_depth < n_cols else [None] * n_rows
+        tops_f = self._clean_str_col(df.iloc[:, idx_top]) if idx_top < n_cols else [None] * n_rows
+
         # ---- detect faults (for "above_fault" rule) ----
         fault_depths: List[float] = []
-        for r in range(len(df)):
-            dep = self._to_float(df.iloc[r, idx_depth]) if idx_depth < df.shape[1] else None
+        for dep, e_code, f_txt in zip(depths, base_codes, tops_f):
             if dep is None:
                 continue
-            e_code = self._clean_str(df.iloc[r, idx_basecode]) if idx_basecode < df.shape[1] else None
-            f_txt = self._clean_str(df.iloc[r, idx_top]) if idx_top < df.shape[1] else None
             if (not e_code) and f_txt and self.fault_regex.search(f_txt):
                 fault_depths.append(float(dep))
         fault_depths = sorted(set(fault_depths))
@@ -880,10 +1260,10 @@ class StratigraphyModel:
 
         # iteration
         start_i = max(0, start_row - 2)
-        for i in range(start_i, len(df)):
-            base_code = self._clean_str(df.iloc[i, idx_basecode]) if idx_basecode < df.shape[1] else None
-            depth = self._to_float(df.iloc[i, idx_depth]) if idx_depth < df.shape[1] else None
-            top_from_f = self._clean_str(df.iloc[i, idx_top]) if idx_top < df.shape[1] else None
+        for i in range(start_i, n_rows):
+            base_code = base_codes[i]
+            depth = depths[i]
+            top_from_f = tops_f[i]
 
             if depth is None:
                 continue
@@ -937,10 +1317,8 @@ class StratigraphyModel:
             above_fault = is_above_fault(float(depth))
 
             below_unit_code: Optional[str] = None
-            if i + 1 < len(df):
-                below_base = self._clean_str(df.iloc[i + 1, idx_basecode]) if idx_basecode < df.shape[1] else None
-                below_topf = self._clean_str(df.iloc[i + 1, idx_top]) if idx_top < df.shape[1] else None
-                below_unit_code = below_base if below_base else below_topf
+            if i + 1 < n_rows:
+                below_unit_code = base_codes[i + 1] or tops_f[i + 1]
 
             # Then change the call to:
             found, top_code, top_name, status = self.find_equivalent_top_for_base_code(
@@ -1024,7 +1402,7 @@ def bgr_sv_load_tree(tree_path: str, schichten_xlsx_path: str):
         force_ch_upto_level=3,
     )
 
-    tree = model.build_from_file(ats_path=tree_path)
+    model.build_from_file(ats_path=tree_path, as_tree=False)
     #with open("testxxx.json", "w", encoding="utf-8") as f:
     #    json.dump(tree, f, ensure_ascii=False, indent=2)
 
@@ -1107,6 +1485,7 @@ def main() -> None:
     ap.add_argument("--fault-regex", default=r"(fault|störung|stoerung)", help="Regex for fault detection in column F")
     ap.add_argument("--cols", default=None, help="Optional JSON to override ATS column mapping")
     ap.add_argument("--out-tree", default="stratigraphy_tree.json", help="Output stratigraphy tree JSON path")
+    ap.add_argument("--ats-cache", default=None, help="Pickle cache of the built ATS tree (reused while the ATS file is unchanged)")
     ap.add_argument("--out-csv", default="schichten_equiv_tops.csv", help="Output analysis CSV path")
     args = ap.parse_args()
 
@@ -1127,7 +1506,11 @@ def main() -> None:
         fault_regex=args.fault_regex,
     )
 
-    tree = model.build_from_file(args.ats, sheet=args.ats_sheet)
+    if not (args.ats_cache and model.load_cache(args.ats_cache, args.ats, sheet=args.ats_sheet)):
+        model.build_from_file(args.ats, sheet=args.ats_sheet, as_tree=False)
+        if args.ats_cache:
+            model.save_cache(args.ats_cache, args.ats, sheet=args.ats_sheet)
+    tree = model.to_json_tree()
     with open(args.out_tree, "w", encoding="utf-8") as f:
         json.dump(tree, f, ensure_ascii=False, indent=2)
 
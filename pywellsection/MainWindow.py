@@ -54,7 +54,8 @@ from pywellsection.io_utils import load_core_data_from_excel
 from pywellsection.widgets import QTextEditLogger, QTextEditCommands
 from pywellsection.console import QIPythonWidget
 from pywellsection.trees import (setup_input_tree, setup_well_widget_tree, setup_window_tree,
-                                 build_stratigraphic_column_tree, connect_input_tree)
+                                 build_stratigraphic_column_tree, connect_input_tree,
+                                 repopulate_checkable_folder, set_lazy_children)
 from pywellsection.dialogs import AssignLasToWellDialog, NewTrackDialog
 from pywellsection.dialogs import AddLogToTrackDialog
 from pywellsection.dialogs import StratigraphyEditorDialog
@@ -2763,90 +2764,21 @@ class MainWindow(QMainWindow):
         #print ("_populate_well_log_tree")
 
         self.well_tree.blockSignals(True)
-        prev_selected = set()
-        ### Start with populating the continous logs tree ###
-        root = self.continous_logs_folder
-        for i in range(root.childCount()):
-            it = root.child(i)
-            if it.checkState(0) == Qt.Checked:
-                prev_selected.add(it.data(0, Qt.UserRole))
-        # remove all wells under the folder
-        root.takeChildren()
+        self.well_tree.setUpdatesEnabled(False)
 
-        log_names = set()
-        if self.all_logs:
-            for log in self.all_logs:
-                name = log
-                if name:
-                    log_names.add(name)
-            for name in sorted(log_names):
-                it = QTreeWidgetItem([name])
-                it.setFlags(
-                    it.flags()
-                    | Qt.ItemIsUserCheckable
-                    | Qt.ItemIsSelectable
-                    | Qt.ItemIsEnabled
-                )
-                it.setData(0, Qt.UserRole, name)
-                state = Qt.Checked if (not prev_selected or name in prev_selected) else Qt.Unchecked
-                it.setCheckState(0, state)
-                root.addChild(it)
+        ### Start with populating the continous logs tree ###
+        log_names = {name for name in (self.all_logs or []) if name}
+        repopulate_checkable_folder(self.continous_logs_folder, sorted(log_names))
 
         ### Second discrete Logs ###
-        prev_selected = set()
-        root = self.discrete_logs_folder
-        for i in range(root.childCount()):
-            it = root.child(i)
-            if it.checkState(0) == Qt.Checked:
-                prev_selected.add(it.data(0, Qt.UserRole))
-        root.takeChildren()
-
-        dlog_names = set()
-        if self.all_discrete_logs:
-            for dlog in self.all_discrete_logs:
-                name = dlog
-                if dlog:
-                    dlog_names.add(name)
-            for name in sorted(dlog_names):
-                it = QTreeWidgetItem([name])
-                it.setFlags(
-                    it.flags()
-                    | Qt.ItemIsUserCheckable
-                    | Qt.ItemIsSelectable
-                    | Qt.ItemIsEnabled
-                )
-                it.setData(0, Qt.UserRole, name)
-                state = Qt.Checked if (not prev_selected or name in prev_selected) else Qt.Unchecked
-                it.setCheckState(0, state)
-                root.addChild(it)
+        dlog_names = {name for name in (self.all_discrete_logs or []) if name}
+        repopulate_checkable_folder(self.discrete_logs_folder, sorted(dlog_names))
 
         ### Third bitmap Logs ###
-        prev_selected = set()
-        root = self.bitmaps_folder
-        for i in range(root.childCount()):
-            it = root.child(i)
-            if it.checkState(0) == Qt.Checked:
-                prev_selected.add(it.data(0, Qt.UserRole))
-        root.takeChildren()
-        bmp_names = set()
-        if self.all_bitmaps:
-            for bmp in self.all_bitmaps:
-                name = bmp
-                if bmp:
-                    bmp_names.add(name)
-            for name in sorted(bmp_names):
-                it = QTreeWidgetItem([name])
-                it.setFlags(
-                    it.flags()
-                    | Qt.ItemIsUserCheckable
-                    | Qt.ItemIsSelectable
-                    | Qt.ItemIsEnabled
-                )
-                it.setData(0, Qt.UserRole, name)
-                state = Qt.Checked if (not prev_selected or name in prev_selected) else Qt.Unchecked
-                it.setCheckState(0, state)
-                root.addChild(it)
+        bmp_names = {name for name in (self.all_bitmaps or []) if name}
+        repopulate_checkable_folder(self.bitmaps_folder, sorted(bmp_names))
 
+        self.well_tree.setUpdatesEnabled(True)
         self.well_tree.blockSignals(False)
         self._rebuild_visible_logs_from_tree()
         self._rebuild_visible_bitmaps_from_tree()
@@ -2871,6 +2803,7 @@ class MainWindow(QMainWindow):
         self.well_tree.blockSignals(True)
         root.takeChildren()
 
+        track_items = []
         for track in self.all_tracks:
             track_name = track.get("name") or "Track"
             track_item = QTreeWidgetItem([track_name])
@@ -2890,21 +2823,13 @@ class MainWindow(QMainWindow):
             )
             track_item.setCheckState(0, state)
 
-            # add logs as children (structural only)
-            for log_cfg in track.get("logs", []):
-                log_name = log_cfg.get("log")
-                if not log_name:
-                    continue
-                log_item = QTreeWidgetItem([log_name])
-                log_item.setFlags(
-                    log_item.flags()
-                    | Qt.ItemIsSelectable
-                    | Qt.ItemIsEnabled
-                )
-                track_item.addChild(log_item)
+            # add logs as children (structural only), created when the track is expanded
+            set_lazy_children(track_item, [log_cfg.get("log") for log_cfg in track.get("logs", [])])
 
-            root.addChild(track_item)
+            track_items.append(track_item)
 
+        # attach all tracks at once (one model update instead of one per track)
+        root.addChildren(track_items)
         self.well_tree.blockSignals(False)
         self._rebuild_visible_tracks_from_tree()
         self.panel.draw_well_panel()
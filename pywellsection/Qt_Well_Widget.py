@@ -21,7 +21,6 @@ from PySide6.QtCore import Signal as pyqtSignal
 from PySide6.QtGui import QPalette
 
 from .multi_wells_panel import draw_multi_wells_panel_on_figure
-from .multi_wells_panel import add_tops_and_correlations
 from .sample_data import create_dummy_data
 from .dialogs import EditFormationTopDialog
 from .dialogs import AddFormationTopDialog
@@ -138,6 +137,7 @@ class  WellPanelWidget(QWidget):
         self._pick_cid = None         # global click handler id
         self._dialog_pick_cid = None  # one-shot pick-on-plot handler id
         self._motion_pick_cid = None
+        self._pick_draw_cid = None    # recaptures the blit background
         self._in_dialog_pick_mode = False
         self._active_top_dialog = None
         self._active_pick_context = None  # {'wi': int, 'formation_name': str}
@@ -149,6 +149,9 @@ class  WellPanelWidget(QWidget):
 
         # hatched moving line during 'pick on plot'
         self._pick_line_artists = []
+        self._pick_line_wi = None
+        self._pick_bg = None  # blit background without the pick lines
+        self._pick_bg_size = None
 
         self._picked_depth = None
         self._picked_formation = None
@@ -226,8 +229,8 @@ class  WellPanelWidget(QWidget):
                 self.current_depth_window = visible_depth_range
             self._preserve_depth_window_on_next_draw = False
 
-            # 2) Redraw everything (this will clear fig and rebuild axe
-            self.fig.clear()
+            # 2) Redraw everything (axes are rebuilt only if the layout changed)
+            self._disconnect_ylim_sync()
             self._corr_artists = []
             flatten_depths = self._flatten_depths
             visible_tops = self.visible_tops
@@ -561,6 +564,10 @@ class  WellPanelWidget(QWidget):
         self._motion_pick_cid = self.canvas.mpl_connect(
             "motion_notify_event", self._handle_dialog_pick_move
         )
+        if self._pick_draw_cid is None:
+            self._pick_draw_cid = self.canvas.mpl_connect(
+                "draw_event", self._on_pick_draw
+            )
 
     def _clear_pick_line(self):
         for art in self._pick_line_artists:
@@ -569,8 +576,17 @@ class  WellPanelWidget(QWidget):
             except Exception:
                 pass
         self._pick_line_artists = []
+        self._pick_line_wi = None
+        self._pick_bg = None
         self.canvas.draw_idle()
 
+    def _on_pick_draw(self, event):
+        """Recapture the blit background after every full redraw (scroll, zoom, resize)."""
+        if not self._pick_line_artists:
+            return
+        self._pick_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._pick_bg_size = self.canvas.get_width_height()
+
     def _handle_dialog_pick_click(self, event):
         """Click once to set depth and return to dialog."""
         if not self._in_dialog_pick_mode:
@@ -618,6 +634,9 @@ class  WellPanelWidget(QWidget):
         if self._motion_pick_cid is not None:
             self.canvas.mpl_disconnect(self._motion_pick_cid)
             self._motion_pick_cid = None
+        if self._pick_draw_cid is not None:
+            self.canvas.mpl_disconnect(self._pick_draw_cid)
+            self._pick_draw_cid = None
 
         self._in_dialog_pick_mode = False
         self._clear_pick_line()
@@ -785,12 +804,15 @@ class  WellPanelWidget(QWidget):
                     #print ("added ax number:", first_track_idx + ti+1 )
                     self.axis_index[ax] = (wi, ti)
 
-    def _connect_ylim_sync(self):
-        # disconnect old if any
+    def _disconnect_ylim_sync(self):
         for ax, cid in getattr(self, "_ylim_cids", []):
             ax.callbacks.disconnect(cid)
         self._ylim_cids = []
 
+    def _connect_ylim_sync(self):
+        # disconnect old if any
+        self._disconnect_ylim_sync()
+
         for ax in self.axes:
             cid = ax.callbacks.connect("ylim_changed", self._on_ylim_changed)
             self._ylim_cids.append((ax, cid))
@@ -810,23 +832,8 @@ class  WellPanelWidget(QWidget):
                     continue
                 ax.set_ylim(new_ylim)
 
-            # remove old correlation artists
-            for art in self._corr_artists:
-                art.remove()
-            self._corr_artists.clear()
-
-            # recompute correlations with current zoom
-            add_tops_and_correlations(
-                self.fig,
-                self.axes,
-                self.wells,
-                self.well_main_axes,
-                len(self.tracks),
-                correlations_only=True,
-                corr_artists=self._corr_artists,
-                flatten_depths=self._flatten_depths
-            )
-
+            # correlation lines/fills live in spacer data coordinates and
+            # follow the new limits, nothing to rebuild here
             self.canvas.draw_idle()
         finally:
             self._syncing_ylim = False
@@ -905,7 +912,7 @@ class  WellPanelWidget(QWidget):
             return
 
         wi_target = self._active_pick_context["wi"]
-        print ("currently_picked:" ,wi_target)
+        LOG.debug("currently_picked: %s", wi_target)
         depth = float(event.ydata)
         flatten_depth = self._get_flatten_offset_for_well(wi_target)
 
@@ -933,31 +940,43 @@ class  WellPanelWidget(QWidget):
         #LOG.debug("move", event.ydata, min, max, depth, flatten_depth)
 
 
-        # draw a thin hatched band across ALL tracks of the selected well
-        self._clear_pick_line()
-
-        if self.visible_tracks is None: # in this case all tracks are visible
-            self.visible_tracks = [t.get("name") for t in self.tracks]
-        n_tracks = len(self.visible_tracks)
-        first_track_idx = wi_target * (n_tracks + 2)
-
-
-
-        for ti in range(n_tracks):
-            base_ax = self.axes[first_track_idx + ti +1]
-
-            # choose a small thickness relative to the depth range
-            y0, y1 = base_ax.get_ylim()
+        # draw a thin line across ALL tracks of the selected well; the lines
+        # are created once (animated) and moved with blitting afterwards
+        # rebuild when the figure was redrawn from scratch (lines on stale axes)
+        fig_axes = self.fig.axes
+        if (self._pick_line_wi != wi_target or self._pick_bg is None
+                or self._pick_bg_size != self.canvas.get_width_height()
+                or any(band.axes not in fig_axes for band in self._pick_line_artists)):
+            for art in self._pick_line_artists:
+                try:
+                    art.remove()
+                except Exception:
+                    pass
+            self._pick_line_artists = []
 
+            if self.visible_tracks is None: # in this case all tracks are visible
+                self.visible_tracks = [t.get("name") for t in self.tracks]
+            n_tracks = len(self.visible_tracks)
+            first_track_idx = wi_target * (n_tracks + 2)
 
-            band = base_ax.axhline(depth+flatten_depth, color="tab:red", lw=1.2, ls="--", zorder=10)
+            for ti in range(n_tracks):
+                base_ax = self.axes[first_track_idx + ti +1]
+                band = base_ax.axhline(depth+flatten_depth, color="tab:red", lw=1.2, ls="--", zorder=10,
+                                       animated=True)
+                self._pick_line_artists.append(band)
 
-            self._pick_line_artists.append(band)
-            #if True: return
-            #self.draw_well_panel()
+            # background = full figure without the (animated) pick lines,
+            # captured by _on_pick_draw
+            self.canvas.draw()
+            self._pick_line_wi = wi_target
+        else:
+            for band in self._pick_line_artists:
+                band.set_ydata([depth+flatten_depth, depth+flatten_depth])
 
-        self.canvas.draw_idle()
-        #self.draw_well_panel()
+        self.canvas.restore_region(self._pick_bg)
+        for band in self._pick_line_artists:
+            band.axes.draw_artist(band)
+        self.canvas.blit(self.fig.bbox)
 
     def _clear_temp_highlight(self):
         """Remove any temporary highlight artists (selected top)."""
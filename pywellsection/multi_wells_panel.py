@@ -1,15 +1,16 @@
 import matplotlib.pyplot as plt
 import matplotlib
-from matplotlib.ticker import FuncFormatter
+from matplotlib.ticker import Formatter
 from matplotlib.ticker import (MultipleLocator, AutoMinorLocator)
 from matplotlib.ticker import FormatStrFormatter
 from matplotlib.lines import Line2D
 import matplotlib.patches as patches
 from matplotlib.image import BboxImage
-from matplotlib.transforms import Bbox, TransformedBbox
+from matplotlib.transforms import Bbox, TransformedBbox, blended_transform_factory
 from matplotlib.patches import Polygon
-from matplotlib.collections import LineCollection
-from pywellsection.tools import _well_distance_m
+from matplotlib.collections import LineCollection, PatchCollection, PolyCollection
+from matplotlib.colors import to_rgba
+from pywellsection.tools import _adjacent_well_distances_m, _well_distance_m
 
 import numpy as np
 
@@ -17,7 +18,9 @@ from numpy import ndarray
 from numpy import dtype
 from typing import Any
 
+import functools
 import logging
+import os
 import pandas as pd
 from pathlib import Path
 
@@ -57,6 +60,20 @@ LOG.setLevel("DEBUG")
 #
 # matplotlib.hatch._hatch_types.append(CustomHatch)
 
+class _OffsetDepthFormatter(Formatter):
+    """Label flattened plot depths with their TRUE depth (plot depth + offset)."""
+
+    def __init__(self, off):
+        self.off = float(off)
+
+    def __call__(self, y, pos=None):
+        return f"{y + self.off:.2f}"
+
+    def format_ticks(self, values):
+        # one vectorized call per draw instead of one callback per tick
+        return np.char.mod("%.2f", np.asarray(values, dtype=float) + self.off).tolist()
+
+
 def scale_track_xaxis_fonts(fig, axes, wells, n_tracks, track_xaxes,
                             min_size=6, max_size=11):
     """
@@ -114,6 +131,23 @@ def scale_track_xaxis_fonts(fig, axes, wells, n_tracks, track_xaxes,
                 ticklabel.set_fontsize(size * 0.9)
 
 
+_RC_CONFIGURED = False
+
+
+def _configure_rc_for_panels():
+    """
+    One-time rcParams tuning for patch/path heavy panels: simplify paths and
+    let agg render long paths (log curves) in chunks.
+    """
+    global _RC_CONFIGURED
+    if _RC_CONFIGURED:
+        return
+    matplotlib.rcParams["path.simplify"] = True
+    matplotlib.rcParams["path.simplify_threshold"] = 1.0
+    matplotlib.rcParams["agg.path.chunksize"] = 10000
+    _RC_CONFIGURED = True
+
+
 def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_factor=3.0, track_gap_factor=0.5,
                                      track_width = 1.0, corr_artists=None, highlight_top=None, flatten_depths=None,
                                      visible_wells=None, visible_tops = None, visible_logs = None,
@@ -137,7 +171,7 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
 
     #print(f" draw ! visible tops: {visible_tops}")
 
-    fig.clf()
+    _configure_rc_for_panels()
 
     if visible_wells is None:
         visible_wells = [w["name"] for w in wells]
@@ -145,6 +179,7 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
     n_wells = len(visible_wells)
 
     if n_wells == 0:
+        fig.clf()
         return n_wells
 
     selected_wells = [w for w in wells if (w.get("name") in visible_wells)]
@@ -203,7 +238,8 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
             global_top_plot = top_depth_window + offsets[0]
             global_bottom_plot = bottom_depth_window + offsets[0]
     else:
-        print ("does this ever happen?")
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("no depth window given, deriving plot range from well extents")
         top_plot_candidates = []
         bottom_plot_candidates = []
         for off in offsets:
@@ -226,7 +262,8 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
 
     global_top_plot, global_bottom_plot = depth_window
 
-    print(f"DRAWING         global_top_plot={global_top_plot:.2f} global_bottom_plot={global_bottom_plot:.2f}")
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug("drawing global_top_plot=%.2f global_bottom_plot=%.2f", global_top_plot, global_bottom_plot)
 
 
 
@@ -236,10 +273,7 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
     gap_factors = []
     if gap_proportional_to_distance and n_wells > 1:
         # distance (meters) between adjacent wells
-        dists = []
-        for i in range(n_wells - 1):
-            d = _well_distance_m(wells[i], wells[i + 1])
-            dists.append(d)
+        dists = _adjacent_well_distances_m(wells)
 
         # Convert distance to ratio relative to reference distance
         # factor = well_gap_factor * clamp( dist / ref )
@@ -279,18 +313,30 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
     bottom_margin = min(max(0.10 / safe_scale, 0.04), 0.35)
     top_margin = min(max(0.8 * safe_scale, bottom_margin + 0.20), 0.96)
 
-    gs = fig.add_gridspec(
-        1,
-        total_cols,
-        width_ratios=width_ratios,
-        wspace=0.05,
-        left=0.1,
-        right=0.90,
-        top=top_margin,
-        bottom=bottom_margin,
-    )
+    # Reuse the axes of the previous draw when only data/limits changed
+    layout_key = (n_wells, n_tracks, tuple(width_ratios), top_margin, bottom_margin)
+    axes = _reuse_layout_axes(fig, layout_key)
+
+    if axes is None:
+        fig.clf()
+
+        gs = fig.add_gridspec(
+            1,
+            total_cols,
+            width_ratios=width_ratios,
+            wspace=0.05,
+            left=0.1,
+            right=0.90,
+            top=top_margin,
+            bottom=bottom_margin,
+        )
+
+        axes = [fig.add_subplot(gs[0, i]) for i in range(total_cols)]
+        fig._pyws_layout = (layout_key, axes)
 
-    axes = [fig.add_subplot(gs[0, i]) for i in range(total_cols)]
+    # twin axes / log artists from the previous draw (dead ones are evicted)
+    log_cache = _get_log_artist_cache(fig)
+    used_log_keys = set()
 
     # Turn off spacer axes
     for ax, is_spacer in zip(axes, col_is_spacer):
@@ -311,6 +357,9 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
 
     # ---- 4) Draw wells ----
 
+    # pure-data phase: prepared log arrays per well, before any artist is made
+    well_specs = _build_all_well_specs(selected_wells, filtered_tracks, offsets, visible_logs)
+
     for wi, well in enumerate(selected_wells):
 
         ref_depth = well["reference_depth"]
@@ -319,11 +368,12 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
         offset = offsets[wi]  # TRUE depth offset for this well
 
         if offset != 0.0:
-            depth_formatter = FuncFormatter(lambda y, pos, off=offset: f"{(y + off):.2f}")
+            depth_formatter = _OffsetDepthFormatter(offset)  # one per axis, Formatter binds to its axis
         else:
             depth_formatter = None
 
-        LOG.debug(f"depth_formatter={depth_formatter}")
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("depth_formatter=%s", depth_formatter)
 
         first_track_idx = wi * (n_tracks + 2)
 
@@ -383,7 +433,10 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
             #     base_ax.set_title(well.get("name", f"Well {wi + 1}"), fontsize=10)
 
 
-            Add_logs_to_track(base_ax, offset, track, visible_logs, well)
+            prepared = {ln: v for (t, ln), v in well_specs[wi].items() if t == ti}
+            Add_logs_to_track(base_ax, offset, track, visible_logs, well,
+                              log_cache=log_cache, cache_key=(wi, ti), used_keys=used_log_keys,
+                              prepared=prepared)
 
             if track.get("type") == "bitmap":
                 _draw_bitmap_track(base_ax,well, track, offset, visible_bitmaps)
@@ -396,6 +449,8 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
                 _draw_lithofacies_track(base_ax,well,track, offset)
 
 
+    _prune_log_artist_cache(log_cache, used_log_keys)
+
     add_depth_range_labels(fig, axes, selected_wells, n_tracks)
     add_well_names(fig, axes, selected_wells, n_tracks)
 
@@ -419,15 +474,172 @@ def draw_multi_wells_panel_on_figure(fig,wells,tracks,suptitle=None,well_gap_fac
 
     if suptitle:
         fig.suptitle(suptitle, fontsize=14, y=0.97)
+    elif getattr(fig, "_suptitle", None) is not None:
+        fig._suptitle.remove()
+        fig._suptitle = None
 
     #
 
-    print("now axes limits are:",axes[0].get_ylim())
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug("axes limits after draw: %s", axes[0].get_ylim())
 
     return axes, well_main_axes
 
 
-def Add_logs_to_track(base_ax, offset, track, visible_logs, well):
+def _reuse_layout_axes(fig, layout_key):
+    """
+    Return the axes of the previous draw if the figure still holds exactly
+    that layout (same layout_key, no foreign axes), cleared for redrawing.
+    Figure-level texts/artists of the previous draw are removed as well.
+    Returns None if the layout has to be rebuilt; the log artist cache is
+    then emptied, as its twin axes go away with the old layout.
+    """
+    log_cache = getattr(fig, "_pyws_cache", {})
+    cached = getattr(fig, "_pyws_layout", None)
+    if cached is None or cached[0] != layout_key:
+        log_cache.clear()
+        return None
+
+    axes = cached[1]
+    layout_set = set(axes)
+    twin_set = {entry["twin_ax"] for entry in log_cache.values()}
+    fig_axes = set(fig.axes)
+    if not layout_set <= fig_axes or not fig_axes <= (layout_set | twin_set):
+        log_cache.clear()
+        return None
+
+    for ax in axes:
+        ax.clear()
+
+    # twin axes hanging off axes that are not part of this layout are stale
+    for key in [k for k, entry in log_cache.items() if entry["base_ax"] not in layout_set]:
+        try:
+            log_cache.pop(key)["twin_ax"].remove()
+        except Exception:
+            pass
+
+    suptitle = getattr(fig, "_suptitle", None)
+    for art in list(fig.texts) + list(fig.artists) + list(fig.lines) + list(fig.patches):
+        if art is not suptitle:
+            art.remove()
+
+    return axes
+
+
+def _get_log_artist_cache(fig):
+    """
+    Return the per-figure cache of log twin axes and artists.
+
+    The cache maps (well key, cache_key, log_name) -> dict with the keys
+    'base_ax', 'twin_ax', 'artist' and 'render'; the well key is its UWI
+    (or name), so entries never depend on reused id() values. Entries whose twin axis is
+    no longer part of the figure (e.g. after fig.clf()) are dropped.
+    """
+    cache = getattr(fig, "_pyws_cache", None)
+    if cache is None:
+        cache = {}
+        fig._pyws_cache = cache
+
+    live_axes = set(fig.axes)
+    for key in [k for k, entry in cache.items() if entry["twin_ax"] not in live_axes]:
+        del cache[key]
+    return cache
+
+
+def _prune_log_artist_cache(cache, used_keys):
+    """Remove twin axes of logs that were not drawn in the current pass."""
+    for key in [k for k in cache if k not in used_keys]:
+        entry = cache.pop(key)
+        try:
+            entry["twin_ax"].remove()
+        except Exception:
+            pass
+
+
+def _prepare_log_xy(depth, data, log_cfg, offset):
+    """
+    Pure-numpy data preparation of one continuous log.
+
+    Returns (x, y, depth_plot) where x/y are the masked/decimated/clipped
+    samples to plot and depth_plot is the full flattened depth array.
+    """
+    decimate = int(log_cfg.get("decimate", 1))
+    clip = bool(log_cfg.get("clip", True))
+    mask_nan = bool(log_cfg.get("mask_nan", False))
+
+    # plotting depth: flattened if offset != 0
+    depth_plot = np.asarray(depth, dtype=float) - offset
+
+    x = np.asarray(data)
+    y = depth_plot
+
+    # build one index array and gather x/y once
+    if mask_nan:
+        idx = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    else:
+        idx = np.arange(min(len(x), len(y)))
+
+    if decimate > 1:
+        idx = idx[::decimate]
+
+    if clip and "xlim" in log_cfg:
+        xmin, xmax = log_cfg["xlim"]
+        xs = x[idx]
+        m = (xs >= xmin) & (xs <= xmax)
+        n = np.isnan(xs) & np.isnan(y[idx])
+        idx = idx[np.logical_or(np.logical_not(n), m)]
+
+    x = x[idx]
+    y = y[idx]
+
+    return x, y, depth_plot
+
+
+def build_well_artist_specs(well, tracks, offset, visible_logs):
+    """
+    Prepare the plot data of all continuous logs of one well.
+
+    Returns a dict (track_index, log_name) -> (x, y, depth_plot); no
+    artists are created here.
+    """
+    specs = {}
+    logs = well.get("logs", {})
+    for ti, track in enumerate(tracks):
+        for log_cfg in track.get("logs", []):
+            log_name = log_cfg["log"]
+            if visible_logs is not None and log_name not in visible_logs:
+                continue
+            log_def = logs.get(log_name)
+            if log_def is None:
+                continue
+            depth = log_def["depth"]
+            data = log_def["data"]
+            if depth is None or data is None or len(depth) == 0 or len(data) == 0:
+                continue
+            specs[(ti, log_name)] = _prepare_log_xy(depth, data, log_cfg, offset)
+    return specs
+
+
+def _build_all_well_specs(wells, tracks, offsets, visible_logs):
+    """Run build_well_artist_specs for all wells."""
+    return [
+        build_well_artist_specs(well, tracks, offsets[wi], visible_logs)
+        for wi, well in enumerate(wells)
+    ]
+
+
+def Add_logs_to_track(base_ax, offset, track, visible_logs, well,
+                      log_cache=None, cache_key=None, used_keys=None, prepared=None):
+    """
+    Draw the continuous logs of one track into twiny axes of base_ax.
+
+    If log_cache is given, twin axes and curve artists are reused across
+    redraws (keyed by well, cache_key and log name) and only their data is
+    updated; used_keys collects the keys touched in this pass.
+
+    prepared optionally maps log_name -> (x, y, depth_plot) as returned by
+    _prepare_log_xy (see build_well_artist_specs).
+    """
 
     curve_cache = {}
     j=0
@@ -449,10 +661,34 @@ def Add_logs_to_track(base_ax, offset, track, visible_logs, well):
         data = log_def["data"]
         if depth is None or data is None or len(depth) == 0 or len(data) == 0:
             continue
-        mask = [x > 0 for x in depth]
-        # plotting depth: flattened if offset != 0
-        depth_plot = [x - offset for x in depth]
-        twin_ax = base_ax.twiny()
+
+        # --- prepare data ---
+        if prepared is not None and log_name in prepared:
+            x, y, depth_plot = prepared[log_name]
+        else:
+            x, y, depth_plot = _prepare_log_xy(depth, data, log_cfg, offset)
+
+        key = None
+        cached = None
+        if log_cache is not None:
+            key = (well.get("UWI") or well.get("name"), cache_key, log_name)
+            cached = log_cache.get(key)
+            if cached is not None and cached["base_ax"] is not base_ax:
+                try:
+                    cached["twin_ax"].remove()
+                except Exception:
+                    pass
+                cached = None
+            if used_keys is not None:
+                used_keys.add(key)
+
+        if cached is not None:
+            twin_ax = cached["twin_ax"]
+        else:
+            twin_ax = base_ax.twiny()
+            cached = {"base_ax": base_ax, "twin_ax": twin_ax, "artist": None, "render": None}
+            if key is not None:
+                log_cache[key] = cached
         label = log_cfg.get("label", log_name)
         # --- extract settings ---
         render = (log_cfg.get("render", "line") or "line").lower()
@@ -461,47 +697,32 @@ def Add_logs_to_track(base_ax, offset, track, visible_logs, well):
         linewidth = float(log_cfg.get("linewidth", 1.0))
         marker = log_cfg.get("marker", ".")
         markersize = float(log_cfg.get("markersize", 2.0))
-        decimate = int(log_cfg.get("decimate", 1))
-        clip = bool(log_cfg.get("clip", True))
-        mask_nan = bool(log_cfg.get("mask_nan", False))
         zorder = int(log_cfg.get("zorder", 2))
 
-        # --- prepare data ---
-        x = np.asarray(data)
-        y = np.asarray(depth_plot)
-
-        if mask_nan:
-            m = np.isfinite(x) & np.isfinite(y)
-            x = x[m]
-            y = y[m]
-
-        if decimate > 1:
-            x = x[::decimate]
-            y = y[::decimate]
-
-        if clip and "xlim" in log_cfg:
-            xmin, xmax = log_cfg["xlim"]
-            m = (x >= xmin) & (x <= xmax)
-            n = np.isnan(x) & np.isnan(y)
-            m = np.logical_or(np.logical_not(n),m)
-
-            x = x[m]
-            y = y[m]
-
-        mask = [t > 0 for t in x]
-
-
         # --- plot ---
+        artist = cached["artist"]
+        reuse = artist is not None and cached["render"] == render and render != "color"
+        if artist is not None and not reuse:
+            try:
+                artist.remove()
+            except Exception:
+                pass
+            artist = None
+
         if render in ("points", "scatter", "markers"):
-            twin_ax.plot(
-                x, y,
-                linestyle="None",
-                marker=marker,
-                markersize=markersize,
-                color=color,
-                alpha=alpha,
-                zorder=zorder,
-            )
+            if reuse:
+                artist.set_data(x, y)
+                artist.set(marker=marker, markersize=markersize, color=color, alpha=alpha, zorder=zorder)
+            else:
+                artist, = twin_ax.plot(
+                    x, y,
+                    linestyle="None",
+                    marker=marker,
+                    markersize=markersize,
+                    color=color,
+                    alpha=alpha,
+                    zorder=zorder,
+                )
         elif render == "color":
             x_min = np.nanmin(x)
             x_max = np.nanmax(x)
@@ -514,16 +735,24 @@ def Add_logs_to_track(base_ax, offset, track, visible_logs, well):
             bbox = twin_ax.get_window_extent()
             width = bbox.width
 
-            colored_line(y_const, depth_plot, x_norm, twin_ax, linewidth=2*width, cmap="viridis")
+            artist = colored_line(y_const, depth_plot, x_norm, twin_ax, linewidth=2*width, cmap="viridis")
         else:
-            twin_ax.plot(
-                x, y,
-                linestyle=log_cfg.get("style", "-"),
-                linewidth=linewidth,
-                color=color,
-                alpha=alpha,
-                zorder=zorder,
-            )
+            if reuse:
+                artist.set_data(x, y)
+                artist.set(linestyle=log_cfg.get("style", "-"), linewidth=linewidth,
+                           color=color, alpha=alpha, zorder=zorder)
+            else:
+                artist, = twin_ax.plot(
+                    x, y,
+                    linestyle=log_cfg.get("style", "-"),
+                    linewidth=linewidth,
+                    color=color,
+                    alpha=alpha,
+                    zorder=zorder,
+                )
+
+        cached["artist"] = artist
+        cached["render"] = render
 
 
         # Only top spine visible
@@ -630,7 +859,7 @@ def _draw_discrete_track(base_ax, well, offset, disc_cfg, visible_discrete_logs
     values = values[order]
 
     # flatten depths for plotting
-    depths_plot = depths - offset  # kept for clarity; directly using top/bot below
+    depths_plot = depths - offset
 
     # we need a bottom bound for the last interval
     ref_depth = well["reference_depth"]
@@ -642,58 +871,58 @@ def _draw_discrete_track(base_ax, well, offset, disc_cfg, visible_discrete_logs
     base_ax.set_xticks([])
     base_ax.set_title(disc_label, fontsize = 5)
 
-    # intervals between samples
-    for i in range(len(depths) - 1):
-        top_phys = depths[i]
-        bot_phys = depths[i + 1]
-        val = int(values[i])
-        if val <= 0:
+    # resolve color/hatch once per distinct code into lookup tables, then
+    # index them with each sample's position among the distinct codes
+    uniq_codes, code_idx = np.unique(values, return_inverse=True)
+    color_lut = np.empty(len(uniq_codes), dtype=object)
+    hatch_lut = np.empty(len(uniq_codes), dtype=object)
+    for k, val in enumerate(uniq_codes.tolist()):
+        entry = dictionary.get(str(val), dictionary.get(val, {}))
+        color_lut[k] = entry.get("color") or color_map.get(val) or color_map.get(str(val), default_color)
+        hatch_lut[k] = entry.get("hatch") or ""
+    colors = color_lut[code_idx]
+    hatches = hatch_lut[code_idx]
+
+    # intervals between samples; the last sample extends to TD
+    bots_plot = np.append(depths_plot[1:], last_bottom_plot)
+
+    for i in range(len(depths)):
+        if values[i] <= 0:
             continue
 
-        top_plot = top_phys - offset
-        bot_plot = bot_phys - offset
+        top_plot = depths_plot[i]
+        bot_plot = bots_plot[i]
 
-        entry = dictionary.get(str(val), dictionary.get(val, {}))
-        col = entry.get("color") or color_map.get(val) or color_map.get(str(val), default_color)
-        hatch = entry.get("hatch", "")
         base_ax.add_patch(
             Rectangle(
                 (0.0, min(top_plot, bot_plot)),
                 1.0,
                 abs(bot_plot - top_plot),
-                facecolor=col,
+                facecolor=colors[i],
                 edgecolor="k",
                 linewidth=0.3,
                 alpha=0.9,
-                hatch=hatch,
+                hatch=hatches[i],
                 zorder=0.8,
             )
         )
 
-    # last sample → extend to TD if not missing
-    last_val = values[-1]
-    last_val = int(last_val)
-    if last_val > 0:
-        top_phys = depths[-1]
-        top_plot = top_phys - offset
-        bot_plot = last_bottom_plot
-
-        entry = dictionary.get(str(last_val), dictionary.get(last_val, {}))
-        col = entry.get("color") or color_map.get(last_val) or color_map.get(str(last_val), default_color)
-        hatch = entry.get("hatch", "")
-        base_ax.add_patch(
-            Rectangle(
-                (0.0, min(top_plot, bot_plot)),
-                1.0,
-                abs(bot_plot - top_plot),
-                facecolor=col,
-                edgecolor="k",
-                linewidth=0.3,
-                alpha=0.9,
-                hatch=hatch,
-                zorder=0.8,
-            )
-        )
+def _lithofacies_kernel(top, base, h_top, h_base, has_trend, s, w):
+    """
+    Sample depth and hardness of all lithofacies intervals at once.
+
+    top, base, h_top, h_base, has_trend are per-interval arrays (length M);
+    s are the normalized sample positions and w the smoothstep weights
+    (length n_seg). Returns two (M, n_seg) arrays (depths, hardness).
+    """
+    z = top[:, None] + (base - top)[:, None] * s[None, :]
+    h = np.where(
+        has_trend[:, None],
+        h_top[:, None] + (h_base - h_top)[:, None] * w[None, :],
+        h_top[:, None],
+    )
+    return z, h
+
 
 def _draw_lithofacies_track(base_ax,well, track, offset = 0.0):
 
@@ -753,22 +982,30 @@ def _draw_lithofacies_track(base_ax,well, track, offset = 0.0):
             "M":   1.0,
         }
 
-    curve_depths = []
-    curve_hardness = []
+    n_iv = len(intervals)
+    tops = np.empty(n_iv)
+    bases = np.empty(n_iv)
+    h_tops = np.empty(n_iv)
+    h_bases = np.empty(n_iv)
+    has_trend = np.zeros(n_iv, dtype=bool)
+
+    # facecolor / hatch per interval in one vectorized lookup
+    envs = pd.Series([iv.get("environment", "") for iv in intervals], dtype=object)
+    facecolors = envs.map(color_map).fillna("white").to_numpy()
+    hatches = envs.map(hatch_map).fillna("").to_numpy()
 
     # ----------------------------
-    # Draw intervals
+    # Per-interval end members
     # ----------------------------
-    for iv in intervals:
+    for i, iv in enumerate(intervals):
         lt = iv["lithology"]
         trend =iv["trend"]
-        env = iv.get("environment", "")
         top_true = iv["rel_top"]
         base_true = iv["rel_base"]
 
         # Apply flattening transform
-        top_depth = top_true - offset
-        base_depth = base_true - offset
+        tops[i] = top_true - offset
+        bases[i] = base_true - offset
 
         # Parse lithology + trend
         parts = [p.strip() for p in lt.split(",")]
@@ -790,33 +1027,35 @@ def _draw_lithofacies_track(base_ax,well, track, offset = 0.0):
             h_top_raw = h_base_raw = h0
 
         # normalize 1–3 → 0–1
-        h_top = h_top_raw / 3.0 * hardness_scale
-        h_base = h_base_raw / 3.0 * hardness_scale
+        h_tops[i] = h_top_raw / 3.0 * hardness_scale
+        h_bases[i] = h_base_raw / 3.0 * hardness_scale
+        has_trend[i] = trend in ("fu", "cu")
 
-        # spline subdivision
-        s = np.linspace(0, 1, n_seg)
-        z_seg = top_depth + (base_depth - top_depth) * s
+    # spline subdivision, shared by all intervals
+    s = np.linspace(0, 1, n_seg)
+    w = smoothstep(s, smooth)
+    z_segs, h_segs = _lithofacies_kernel(tops, bases, h_tops, h_bases, has_trend, s, w)
 
-        if trend in ("fu", "cu"):
-            #w = spline_func(s)
-            w= smoothstep(s, smooth)
-            h_seg = h_top + (h_base - h_top) * w
-        else:
-            h_seg = np.full_like(s, h_top)
+    curve_depths = z_segs.ravel()
+    curve_hardness = h_segs.ravel()
 
-        curve_depths.extend(z_seg)
-        curve_hardness.extend(h_seg)
+    # ----------------------------
+    # Draw intervals
+    # ----------------------------
+    for i in range(n_iv):
+        z_seg = z_segs[i]
+        h_seg = h_segs[i]
 
         # polygon under curve
-        xs = [0.0] + list(h_seg) + [0.0]
-        ys = [z_seg[0]] + list(z_seg) + [z_seg[-1]]
+        xs = np.concatenate(([0.0], h_seg, [0.0]))
+        ys = np.concatenate(([z_seg[0]], z_seg, [z_seg[-1]]))
 
         poly = Polygon(
-            list(zip(xs, ys)),
+            np.column_stack((xs, ys)),
             closed=True,
-            facecolor=color_map.get(env, "white"),
+            facecolor=facecolors[i],
             edgecolor="black",
-            hatch=hatch_map.get(env, ""),
+            hatch=hatches[i],
             linewidth=0.6,
             alpha=0.9,
             zorder=0.8,
@@ -836,10 +1075,82 @@ def _draw_lithofacies_track(base_ax,well, track, offset = 0.0):
     base_ax.xaxis.set_visible(False)
     base_ax.grid(False)
 
+# decoded bitmap files kept in memory (least recently used are dropped)
+_BITMAP_CACHE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=_BITMAP_CACHE_SIZE)
+def _decode_bitmap(path, mtime, flip):
+    # mtime is only part of the cache key: a replaced file is decoded again
+    import matplotlib.image as mpimg
+
+    img = mpimg.imread(path)
+    if flip:
+        img = np.flipud(img)
+    if img.dtype != np.uint8:
+        img = np.clip(np.rint(img * 255.0), 0, 255).astype(np.uint8)
+    pyramid = [np.ascontiguousarray(img)]
+    while pyramid[-1].shape[0] > 256 and pyramid[-1].shape[1] >= 2:
+        pyramid.append(_halve_bitmap(pyramid[-1]))
+    return tuple(pyramid)
+
+
+def _halve_bitmap(img):
+    """Next pyramid level: mean of each 2x2 block (odd last row/column dropped)."""
+    h = img.shape[0] // 2 * 2
+    w = img.shape[1] // 2 * 2
+    blk = img[:h, :w].astype(np.uint16)
+    total = blk[0::2, 0::2] + blk[1::2, 0::2] + blk[0::2, 1::2] + blk[1::2, 1::2]
+    return ((total + 2) // 4).astype(np.uint8)
+
+
+def _load_bitmap(path, flip=True):
+    """
+    Decode a bitmap file once and keep it as a uint8 mip-map pyramid
+    (level 0 = full resolution, each further level halves rows and columns),
+    so redraws don't hit the disk or copy the image again.
+    """
+    return _decode_bitmap(path, os.path.getmtime(path), bool(flip))
+
+
+def _select_pyramid_level(pyramid, base_ax, top_plot, base_plot):
+    """
+    Index of the smallest pyramid level that still has at least twice as
+    many rows as the bitmap's full depth interval spans in screen pixels on
+    base_ax (zoomed in, that is more than the axis height).
+    """
+    y0, y1 = base_ax.get_ylim()
+    span = abs(y1 - y0) or 1.0
+    frac = abs(base_plot - top_plot) / span
+    target_rows = 2.0 * base_ax.get_window_extent().height * frac
+
+    chosen = 0
+    for i in range(1, len(pyramid)):
+        if pyramid[i].shape[0] < target_rows:
+            break
+        chosen = i
+    return chosen
+
+
+def _follow_pyramid_zoom(base_ax, artist, pyramid, level, top_plot, base_plot):
+    """
+    Swap artist's image to the matching pyramid level whenever the y-limits of
+    base_ax change (zoom / pan without a full panel redraw). ax.clear()
+    drops the callback together with the artist.
+    """
+    current = [level]
+
+    def on_ylim_changed(ax):
+        new_level = _select_pyramid_level(pyramid, ax, top_plot, base_plot)
+        if new_level != current[0]:
+            current[0] = new_level
+            artist.set_data(pyramid[new_level])
+
+    base_ax.callbacks.connect("ylim_changed", on_ylim_changed)
+
+
 def _draw_bitmap_track(base_ax, well, track, offset = 0.0, visible_bitmaps = None):
     #global bitmap
-    import numpy as np
-    import matplotlib.image as mpimg
 
     track_cfg = track.get("bitmap", None)
     track_name = track.get("name", None)
@@ -869,12 +1180,19 @@ def _draw_bitmap_track(base_ax, well, track, offset = 0.0, visible_bitmaps = Non
                     bmp_top = bmp_cfg.get("top_depth", None)
                     bmp_base = bmp_cfg.get("base_depth", None)
                     if bmp_top is not None and bmp_base is not None:
+                        flip = bmp_cfg.get("flip_vertical", True)
+
                         # Load image
                         img = bmp_cfg.get("image", None)
+                        pyramid = None
                         if img is None:
                             path = bmp_cfg.get("path", None)
                             if path:
-                                img = mpimg.imread(path)
+                                pyramid = _load_bitmap(path, flip)
+                                img = pyramid[0]
+                        elif flip:
+                            # Optional flip (sometimes needed depending on how image is stored)
+                            img = np.flipud(img)
 
                         if img is not None:
                             # Normalize order
@@ -885,15 +1203,17 @@ def _draw_bitmap_track(base_ax, well, track, offset = 0.0, visible_bitmaps = Non
                             top_plot = top_phys - offset
                             base_plot = base_phys - offset
 
-                            # Optional flip (sometimes needed depending on how image is stored)
-                            if bmp_cfg.get("flip_vertical", True):
-                                img = np.flipud(img)
+                            # Resolution matching the current on-screen size
+                            level = 0
+                            if pyramid is not None:
+                                level = _select_pyramid_level(pyramid, base_ax, top_plot, base_plot)
+                                img = pyramid[level]
 
                             # IMPORTANT:
                             # - Use extent to map the image into depth coordinates.
                             # - With invert_yaxis(), you typically want origin="upper"
                             #   so row 0 aligns to the top of the interval.
-                            base_ax.imshow(
+                            artist = base_ax.imshow(
                                 img,
                                 extent=(0.0, 1.0, top_plot, base_plot),
                                 aspect="auto",
@@ -903,6 +1223,8 @@ def _draw_bitmap_track(base_ax, well, track, offset = 0.0, visible_bitmaps = Non
                                 interpolation=track_cfg.get("interpolation", "nearest"),
                                 zorder=int(track_cfg.get("zorder", 0)),
                             )
+                            if pyramid is not None:
+                                _follow_pyramid_zoom(base_ax, artist, pyramid, level, top_plot, base_plot)
                 else:
                     continue
 
@@ -938,6 +1260,61 @@ def add_well_names(fig, axes, wells, n_tracks):
         fig.text(mid_x, 0.9, label, ha="center", va="center", fontsize=9)
 
 
+def _get_tops_collection_cache(fig):
+    """
+    Return the per-figure cache of tops/correlation collections.
+
+    The cache maps (kind, ...) -> PolyCollection/LineCollection/Text, with
+    kind one of 'strat_fill', 'corr_line', 'corr_fill' or 'label'.
+    """
+    cache = getattr(fig, "_pyws_tops_collections", None)
+    if cache is None:
+        cache = {}
+        fig._pyws_tops_collections = cache
+    return cache
+
+
+def _reuse_tops_collection(cache, key, ax, used_keys):
+    """
+    Return the cached collection for key attached to ax, or None if a new
+    collection has to be built (nothing cached or it belongs to another axis).
+    """
+    used_keys.add(key)
+    coll = cache.get(key)
+    if coll is None or coll.axes not in (None, ax):
+        return None
+    if coll not in ax.collections:
+        # removed by the caller (corr_artists) or by ax.clear(): attach again
+        ax.add_collection(coll, autolim=False)
+    return coll
+
+
+def _reuse_top_label(cache, key, ax, attached, used_keys):
+    """
+    Return the cached top label Text for key attached to ax, or None if a
+    new label has to be created. attached is the set of ax's children.
+    """
+    used_keys.add(key)
+    text = cache.get(key)
+    if text is None or text.axes not in (None, ax):
+        return None
+    if text not in attached:
+        ax.add_artist(text)
+    return text
+
+
+def _prune_tops_collections(cache, used_keys, kinds):
+    """Remove cached artists of the given kinds not drawn in this pass."""
+    for key in [k for k in cache if k[0] in kinds and k not in used_keys]:
+        art = cache.pop(key)
+        if art.axes is not None:
+            try:
+                art.remove()
+            except (ValueError, NotImplementedError):
+                # already detached (ax.clear() / corr_artists removal)
+                pass
+
+
 def add_tops_and_correlations(fig,axes,wells,well_main_axes,n_tracks,correlations_only=False,corr_artists=None,
     highlight_top=None,flatten_depths=None,visible_tops=None,visible_tracks = None, stratigraphy = None):
     """
@@ -997,6 +1374,16 @@ def add_tops_and_correlations(fig,axes,wells,well_main_axes,n_tracks,correlation
 
     tops_by_name = {}
 
+    # collections of previous calls are updated in place instead of rebuilt
+    coll_cache = _get_tops_collection_cache(fig)
+    used_coll_keys = set()
+
+    # display -> figure coords is the same for all wells
+    fig_inverted = fig.transFigure.inverted()
+
+    # spacer axis between well w and w+1 (layout per well: depth axis, tracks, spacer)
+    spacer_axes = [axes[w * (n_tracks + 2) + n_tracks + 1] for w in range(n_wells - 1)]
+
 
     ## ---- pass 1: per-well tops & (optionally) within-well shading ----
     for wi, (well, main_ax) in enumerate(zip(wells, well_main_axes)):
@@ -1033,77 +1420,137 @@ def add_tops_and_correlations(fig,axes,wells,well_main_axes,n_tracks,correlation
 
         # sort shallow -> deep
         top_items.sort(key=lambda t: t[1])
+
+        # structure-of-arrays view of the sorted tops, built once per well
+        n_tops = len(top_items)
         top_names = [n for n, d, c, lvl in top_items]
-        top_depths = [d for n, d, c, lvl in top_items]
+        top_depths = np.fromiter((d for n, d, c, lvl in top_items), dtype=float, count=n_tops)
+        top_styles = [get_level_style(lvl) for n, d, c, lvl in top_items]
+        top_hatches = np.array([style["hatch"] for style in top_styles], dtype=object)
+        top_rgba = np.array(
+            [to_rgba(c, style["alpha"]) for (n, d, c, lvl), style in zip(top_items, top_styles)],
+            dtype=float,
+        ).reshape(n_tops, 4)
 
         # meta
         top_meta = {}
-        for name, depth, color, level in top_items:
-            style = get_level_style(level)
+        for (name, depth, color, level), style in zip(top_items, top_styles):
             top_meta[name] = {"depth": depth, "color": color, "level": level, "style": style}
-            well_top_depths[wi][name] = depth
+        well_top_depths[wi].update(zip(top_names, top_depths.tolist()))
 
         first_track_idx = wi * (n_tracks + 2)
 
+        # name of the highlighted top in this well (None if not in this well)
+        highlighted_name = highlight_top[1] if highlight_top is not None and highlight_top[0] == wi else None
+
         # Draw top lines and within-well fills only on full pass
         if not correlations_only:
+            # stratigraphy role of each top, resolved once per well
+            top_roles = [strat_map.get(name, {}).get('role', 'stratigraphy') for name in top_names]
+            # interval i spans top i .. top i+1 and is filled if top i is stratigraphy
+            strat_idx = np.flatnonzero([role == 'stratigraphy' for role in top_roles[:-1]])
+
             if n_tracks > 0:
                 plot_axes = [axes[first_track_idx + ti + 1] for ti in range(n_tracks)]
             else:
                 # No visible tracks: draw tops on the depth axis so they are still visible.
                 plot_axes = [main_ax]
 
-            # horizontal top lines in all plotting axes for this well
+            # horizontal top lines: resolve per-top styles once per well,
+            # then add one LineCollection per plotting axis
+            line_depths = []
+            line_colors = []
+            line_styles = []
+            line_widths = []
+            highlighted_line = None
+            for name, role in zip(top_names, top_roles):
+                if role not in ('stratigraphy', 'fault'):
+                    continue
+
+                meta = strat_map.get(name, {})
+                info = top_meta[name]
+                line_color = meta.get('color', info["color"])
+                line_style = meta.get('hatch', '-')
+                linewidth = info["style"]["line_width"]
+
+                if name == highlighted_name:
+                    highlighted_line = (info["depth"], line_color, line_style, linewidth * 1.8)
+                    continue
+
+                line_depths.append(info["depth"])
+                line_colors.append(line_color)
+                line_styles.append(line_style)
+                line_widths.append(linewidth)
+
+            if line_depths:
+                # segments from x=0 to x=1 in axes coords at each top depth
+                line_segs = np.zeros((len(line_depths), 2, 2))
+                line_segs[:, 1, 0] = 1.0
+                line_segs[:, :, 1] = np.asarray(line_depths, dtype=float)[:, None]
+
             for base_ax in plot_axes:
-                for name in top_names:
-
-                    info = top_meta[name]
-
-                    style = info["style"]
-
-                    is_highlighted = (highlight_top is not None
-                                      and highlight_top[0] == wi
-                                      and highlight_top[1] == name)
-
-                    linewidth = style["line_width"] * (1.0 if not is_highlighted else 1.8)
-
-                    meta = strat_map.get(name, {})
-                    role = meta.get('role', 'stratigraphy')
-                    line_color = meta.get('color', info["color"])
-                    line_style = meta.get('hatch', '-')
-
-                    if role in ('stratigraphy', 'fault'):
-                        base_ax.axhline(
-                            info["depth"],
-                            xmin=0.0,
-                            xmax=1.0,
-                            color=line_color,
-                            linestyle=line_style,
-                            linewidth=linewidth,
-                            zorder=1.2 if not is_highlighted else 1.8,
-                        )
-
-            # fill BETWEEN tops in this well using upper top's style
-            if len(top_depths) >= 2:
-                fill_axes = plot_axes if n_tracks == 0 else [axes[first_track_idx + ti + 1] for ti in range(n_tracks)]
-                for i in range(len(top_depths) - 1):
-                    name_upper = top_names[i]
-                    d1 = top_depths[i]
-                    d2 = top_depths[i + 1]
-                    info = top_meta[name_upper]
-                    color = info["color"]
-                    style = info["style"]
-                    if strat_map.get(name_upper, {}).get('role', 'stratigraphy') == 'stratigraphy':
-                        for base_ax in fill_axes:
-                            base_ax.axhspan(
-                                d1,
-                                d2,
-                                facecolor=color,
-                                alpha=style["alpha"],
-                                hatch=style["hatch"],
-                                edgecolor="none",
+                if line_depths:
+                    base_ax.add_collection(
+                        LineCollection(
+                            line_segs,
+                            colors=line_colors,
+                            linestyles=line_styles,
+                            linewidths=line_widths,
+                            transform=base_ax.get_yaxis_transform(),
+                            zorder=1.2,
+                        ),
+                        autolim=False,
+                    )
+                if highlighted_line is not None:
+                    depth, line_color, line_style, linewidth = highlighted_line
+                    base_ax.axhline(
+                        depth,
+                        xmin=0.0,
+                        xmax=1.0,
+                        color=line_color,
+                        linestyle=line_style,
+                        linewidth=linewidth,
+                        zorder=1.8,
+                    )
+
+            # fill BETWEEN tops in this well using upper top's style;
+            # hatch is per collection, so group intervals by hatch and add
+            # one PolyCollection per hatch group and plotting axis
+            if strat_idx.size:
+                fill_groups = {}
+                strat_hatches = top_hatches[strat_idx]
+                for hatch in dict.fromkeys(strat_hatches):
+                    sel = strat_idx[strat_hatches == hatch]
+                    # rectangles spanning x=0..1 in axes coords
+                    d1s = top_depths[sel]
+                    d2s = top_depths[sel + 1]
+                    verts = np.empty((len(sel), 4, 2))
+                    verts[:, :, 0] = (0.0, 1.0, 1.0, 0.0)
+                    verts[:, 0, 1] = d1s
+                    verts[:, 1, 1] = d1s
+                    verts[:, 2, 1] = d2s
+                    verts[:, 3, 1] = d2s
+                    fill_groups[hatch] = (verts, top_rgba[sel])
+
+                for ai, base_ax in enumerate(plot_axes):
+                    for hatch, (verts, facecolors) in fill_groups.items():
+                        key = ("strat_fill", wi, ai, hatch)
+                        pc = _reuse_tops_collection(coll_cache, key, base_ax, used_coll_keys)
+                        if pc is None:
+                            pc = PolyCollection(
+                                verts,
+                                facecolors=facecolors,
+                                edgecolors="none",
+                                hatch=hatch or None,
+                                transform=base_ax.get_yaxis_transform(),
                                 zorder=0.2,
+                                rasterized=True,
                             )
+                            base_ax.add_collection(pc, autolim=False)
+                            coll_cache[key] = pc
+                        else:
+                            pc.set_verts(verts)
+                            pc.set_facecolor(facecolors)
 
             # hatched interval just below deepest formation top
             formation_depths = [
@@ -1118,16 +1565,29 @@ def add_tops_and_correlations(fig,axes,wells,well_main_axes,n_tracks,correlation
                 open_top = deepest_formation
                 open_bottom = min(deepest_formation + thickness, depth_max)
                 if open_bottom > open_top:
+                    # one collection with a rectangle per track axis (not
+                    # across the gaps between tracks): x in figure coords, y in
+                    # depth so it follows zooming; same styling as axhspan
+                    rects = []
                     for base_ax in plot_axes:
-                        base_ax.axhspan(
-                            open_top,
-                            open_bottom,
-                            facecolor="none",
-                            hatch="///",
-                            edgecolor="0.4",
-                            linewidth=0.5,
-                            zorder=0.3,
-                        )
+                        pos = base_ax.get_position()
+                        rects.append(patches.Rectangle((pos.x0, open_top), pos.width, open_bottom - open_top))
+                    hatch_coll = PatchCollection(
+                        rects,
+                        transform=blended_transform_factory(fig.transFigure, main_ax.transData),
+                        facecolor="none",
+                        hatch="///",
+                        edgecolor="0.4",
+                        linewidth=0.5,
+                        zorder=0.3,
+                    )
+                    pos_left = plot_axes[0].get_position()
+                    pos_right = plot_axes[-1].get_position()
+                    hatch_coll.set_clip_box(TransformedBbox(
+                        Bbox([[pos_left.x0, pos_left.y0], [pos_right.x1, pos_left.y1]]),
+                        fig.transFigure,
+                    ))
+                    fig.add_artist(hatch_coll)
 
         # labels + figure-coordinate y positions
         x_min_main, x_max_main = main_ax.get_xlim()
@@ -1136,15 +1596,37 @@ def add_tops_and_correlations(fig,axes,wells,well_main_axes,n_tracks,correlation
         else:
             x_label_pos = x_min_main + 0.02 * (x_max_main - x_min_main)
         #x_label_pos = xmin_main - 0.5 * (xmax_main - xmin_main)
+        x_marker_pos = x_min_main + 0.01 * (x_max_main - x_min_main)
+
+        # y in figure coordinates (current zoom!) for all tops in one batched transform
+        top_pts = np.column_stack((np.full(len(top_names), x_min_main), top_depths))
+        top_yfig = (main_ax.transData + fig_inverted).transform(top_pts)[:, 1].tolist()
+        well_top_yfig[wi].update(zip(top_names, top_yfig))
+
+        # only label tops in (or one view height around) the current view;
+        # correlation bookkeeping below still covers all tops
+        attached = set(main_ax.get_children())
 
-        for name in top_names:
+        for k, name in enumerate(top_names):
             info = top_meta[name]
             depth = info["depth"]
             color = info["color"]
+            y_fig = top_yfig[k]
+
+            # first well carrying a top defines its correlation style
+            entry = tops_by_name.get(name)
+            if entry is None:
+                entry = tops_by_name[name] = {
+                    "color": color,
+                    "level": info["level"],
+                    "style": info["style"],
+                    "entries": [],
+                    "depth": [],
+                }
+            entry["entries"].append((wi, y_fig))
+            entry["depth"].append((wi, depth))
 
-            is_highlighted = (highlight_top is not None
-                              and highlight_top[0] == wi
-                              and highlight_top[1] == name)
+            is_highlighted = name == highlighted_name
 
             # thicker / brighter label for highlighted top
             label_kwargs = {
@@ -1161,17 +1643,24 @@ def add_tops_and_correlations(fig,axes,wells,well_main_axes,n_tracks,correlation
                 "zorder": 2 if not is_highlighted else 3,
             }
 
-            main_ax.text(
-                x_label_pos,
-                depth,
-                name,
-                **label_kwargs,
-            )
+            # update the label of the previous draw in place if there is one
+            label_key = ("label", wi, name)
+            text = _reuse_top_label(coll_cache, label_key, main_ax, attached, used_coll_keys)
+            if text is None:
+                coll_cache[label_key] = main_ax.text(
+                    x_label_pos,
+                    depth,
+                    name,
+                    **label_kwargs,
+                )
+            else:
+                text.set_position((x_label_pos, depth))
+                text.update(label_kwargs)
 
             # Optional: extra marker on highlighted top
             if is_highlighted:
                 main_ax.plot(
-                    [x_min_main + 0.01 * (x_max_main - x_min_main)],
+                    [x_marker_pos],
                     [depth],
                     marker="o",
                     markersize=5,
@@ -1180,96 +1669,68 @@ def add_tops_and_correlations(fig,axes,wells,well_main_axes,n_tracks,correlation
                     zorder=3,
                 )
 
-            # compute y in figure coordinates (current zoom!)
-            px, py = main_ax.transData.transform((x_min_main, depth))
-            _, y_fig = fig.transFigure.inverted().transform((px, py))
-            well_top_yfig[wi][name] = y_fig
-            well_top_depths[wi][name] = depth
-
-            if name not in tops_by_name:
-                tops_by_name[name] = {
-                    "color": color,
-                    "level": info["level"],
-                    "style": info["style"],
-                    "entries": [],
-                    "depth": [],
-                }
-            #tops_by_name[name]["entries"].append((wi, y_fig))
-            tops_by_name[name]["entries"].append((wi, y_fig))
-            tops_by_name[name]["depth"].append((wi, depth))
-
     # ---- pass 2: correlation lines in spacers ----
+    # segments in spacer data coords (x 0..1, depth), one LineCollection per spacer
+    corr_segments = {}
     for name, info in tops_by_name.items():
         color = info["color"]
         style = info["style"]
-        entries = info["entries"]
         depth = info["depth"]
-        if len(entries) < 2:
+        if len(depth) < 2:
             continue
 
-        entries_sorted = sorted(entries, key=lambda t: t[0])
         depth_sorted = sorted(depth, key=lambda t: t[0])
 
-        # previous_depth = None
-        # previous_color = None
-        # previous_style = None
-
         for (w1, depth1), (w2, depth2) in zip(depth_sorted[:-1], depth_sorted[1:]):
-            if w2 !=w1 +1:
+            if w2 != w1 + 1:
                 continue
-            spacer_idx = w1 * (n_tracks + 2) + n_tracks + 1
-            spacer_ax = axes[spacer_idx]
-            spacer_ax.plot((0,1),(depth1,depth2), color=color, linewidth=style["line_width"], linestyle=style["line_style"], zorder=1.5)
-            # if previous_depth is not None:
-            #     spacer_ax.fill_between((0,1), (depth1,depth2), previous_depth,  color=previous_color,
-            #                            alpha=previous_style["alpha"], hatch = previous_style["hatch"],zorder=1.4)
-            # previous_depth = (depth1,depth2)
-            # previous_color = color
-            # previous_style = style
-
-
-        # for (w1, y1), (w2, y2) in zip(entries_sorted[:-1], entries_sorted[1:]):
-        #     if w2 != w1 + 1:
-        #         continue  # only adjacent wells
-        #
-        #     spacer_idx = w1 * (n_tracks + 2) + n_tracks +1
-        #     spacer_ax = axes[spacer_idx]
-        #     left = spacer_ax.get_position().x0
-        #     right = spacer_ax.get_position().x1
-        #
-        #     line = Line2D(
-        #         [left, right],
-        #         [y1, y2],
-        #         transform=fig.transFigure,
-        #         color=color,
-        #         linewidth=style["line_width"],
-        #         linestyle=style["line_style"],
-        #         alpha=0.9,
-        #     )
-        #     fig.add_artist(line)
-        #     corr_artists.append(line)
-        #
-        #     x_min_spacer, x_max_spacer = spacer_ax.get_xlim()
-
-
-
+            segs = corr_segments.setdefault(w1, ([], [], [], []))
+            segs[0].append(((0.0, depth1), (1.0, depth2)))
+            segs[1].append(color)
+            segs[2].append(style["line_width"])
+            segs[3].append(style["line_style"])
+
+    for w1, (segs, colors, linewidths, linestyles) in corr_segments.items():
+        spacer_ax = spacer_axes[w1]
+        key = ("corr_line", w1)
+        lc = _reuse_tops_collection(coll_cache, key, spacer_ax, used_coll_keys)
+        if lc is None:
+            lc = LineCollection(
+                segs,
+                colors=colors,
+                linewidths=linewidths,
+                linestyles=linestyles,
+                zorder=1.5,
+            )
+            spacer_ax.add_collection(lc, autolim=False)
+            coll_cache[key] = lc
+        else:
+            lc.set_segments(segs)
+            lc.set_color(colors)
+            lc.set_linewidth(linewidths)
+            lc.set_linestyle(linestyles)
+        corr_artists.append(lc)
 
     # ---- pass 3: spacer fills between wells ----
+    # quads in spacer data coords (x 0..1, depth), grouped per spacer and
+    # hatch, so every spacer gets one PolyCollection per hatch
     for w1 in range(n_wells - 1):
         w2 = w1 + 1
 
-        shared_names = sorted(
-            set(well_top_depths[w1].keys()) & set(well_top_depths[w2].keys()),
-            key=lambda n: 0.5 * (well_top_depths[w1][n] + well_top_depths[w2][n]),
-        )
-        if len(shared_names) < 2:
+        depths_left = well_top_depths[w1]
+        depths_right = well_top_depths[w2]
+        shared = [n for n in depths_left if n in depths_right]
+        if len(shared) < 2:
             continue
 
-        spacer_idx = w1 * (n_tracks + 2) + n_tracks + 1
-        spacer_ax = axes[spacer_idx]
-        x_left = spacer_ax.get_position().x0
-        x_right = spacer_ax.get_position().x1
+        # order shared tops by mean depth of both wells (stable, like sorted())
+        mean_depths = 0.5 * (np.fromiter((depths_left[n] for n in shared), float, len(shared))
+                             + np.fromiter((depths_right[n] for n in shared), float, len(shared)))
+        shared_names = [shared[i] for i in np.argsort(mean_depths, kind="stable")]
+
+        spacer_ax = spacer_axes[w1]
 
+        fill_groups = {}
         for i in range(len(shared_names) - 1):
             name_upper = shared_names[i]
             name_lower = shared_names[i + 1]
@@ -1278,39 +1739,45 @@ def add_tops_and_correlations(fig,axes,wells,well_main_axes,n_tracks,correlation
                 continue
 
             info = tops_by_name[name_upper]
-            color = info["color"]
             style = info["style"]
 
-            y1_left = well_top_yfig[w1][name_upper]
-            y1_right = well_top_yfig[w2][name_upper]
-            y2_left = well_top_yfig[w1][name_lower]
-            y2_right = well_top_yfig[w2][name_lower]
-
             depth1_left = well_top_depths[w1][name_upper]
             depth1_right = well_top_depths[w2][name_upper]
             depth2_left = well_top_depths[w1][name_lower]
             depth2_right = well_top_depths[w2][name_lower]
 
-            spacer_ax.fill_between([0, 1], [depth1_left, depth1_right], [depth2_left, depth2_right],
-                                    color=color, alpha=style["alpha"], hatch=style["hatch"], zorder=0.1)
-
-            # poly = patches.Polygon(
-            #     [
-            #         (x_left, y1_left),
-            #         (x_right, y1_right),
-            #         (x_right, y2_right),
-            #         (x_left, y2_left),
-            #     ],
-            #     closed=True,
-            #     transform=fig.transFigure,
-            #     facecolor=color,
-            #     alpha=style["alpha"],
-            #     edgecolor="none",
-            #     hatch=style["hatch"],
-            #     zorder=0.2,
-            # )
-            # fig.add_artist(poly)
-            # corr_artists.append(poly)
+            group = fill_groups.setdefault(style["hatch"], ([], []))
+            group[0].append((depth1_left, depth1_right, depth2_right, depth2_left))
+            group[1].append(to_rgba(info["color"], style["alpha"]))
+
+        for hatch, (quad_depths, facecolors) in fill_groups.items():
+            quads = np.empty((len(quad_depths), 4, 2))
+            quads[:, :, 0] = (0.0, 1.0, 1.0, 0.0)
+            quads[:, :, 1] = quad_depths
+            key = ("corr_fill", w1, hatch)
+            pc = _reuse_tops_collection(coll_cache, key, spacer_ax, used_coll_keys)
+            if pc is None:
+                pc = PolyCollection(
+                    quads,
+                    facecolors=facecolors,
+                    edgecolors=facecolors,  # fill_between(color=...) hatches in the fill color
+                    linewidths=0,
+                    hatch=hatch or None,
+                    zorder=0.1,
+                    rasterized=True,
+                )
+                spacer_ax.add_collection(pc, autolim=False)
+                coll_cache[key] = pc
+            else:
+                pc.set_verts(quads)
+                pc.set_facecolor(facecolors)
+                pc.set_edgecolor(facecolors)
+            corr_artists.append(pc)
+
+    # drop collections whose tops/wells vanished; within-well fills are
+    # only (re)drawn on a full pass
+    pruned_kinds = ("corr_line", "corr_fill", "label") if correlations_only else ("strat_fill", "corr_line", "corr_fill", "label")
+    _prune_tops_collections(coll_cache, used_coll_keys, pruned_kinds)
 
     return corr_artists
 
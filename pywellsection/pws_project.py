@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from typing import Any, Dict, List, Optional, Tuple
 import datetime
 import copy
@@ -53,6 +53,10 @@ class PWSWindowSpec:
         return obj
 
     def to_dict(self) -> Dict[str, Any]:
+        """Shallow field dict (shares payload/geometry); use to_dict_deep() for a snapshot."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def to_dict_deep(self) -> Dict[str, Any]:
         return asdict(self)
 
 
@@ -61,18 +65,26 @@ class PWSWindowSpec:
 # ============================================================
 
 from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 import datetime
 import copy
+import logging
+
+LOG = logging.getLogger(__name__)
 
 
 @dataclass
 class PWSProject:
+    # bump when the serialized layout changes; projects carrying the current
+    # value are loaded as-is without running the legacy migration
+    SCHEMA_VERSION: ClassVar[int] = 2
+
     # ---- identity / metadata ----
     name: str = ""
     type: str = "project"
     version: str = "0.0.1"
     project_file_version: str = "2.0"
+    schema_version: int = SCHEMA_VERSION
 
     # ---- spatial metadata ----
     crs: Optional[Any] = None
@@ -104,8 +116,27 @@ class PWSProject:
 
     def touch_modified(self):
         self.modified_utc = datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z"
+        self.schema_version = self.SCHEMA_VERSION
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "PWSProject":
+        """Rebuild a project from to_dict() output (unknown keys are ignored)."""
+        dd = dict(d or {})
+        known = {f.name for f in fields(cls)}
+        obj = cls(**{k: v for k, v in dd.items() if k in known})
+        if isinstance(obj.extent, list):
+            obj.extent = tuple(obj.extent)
+        return obj
 
     def to_dict(self) -> Dict[str, Any]:
+        """
+        Shallow field dict for serialization: the collections are shared with
+        the project, not copied (json.dump walks them anyway). Use
+        to_dict_deep() for an independent snapshot.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def to_dict_deep(self) -> Dict[str, Any]:
         return asdict(self)
 
     def reset(self, keep_metadata: bool = True):
@@ -145,22 +176,35 @@ class PWSProject:
 # 3) Migration helper: legacy JSON -> PWSProject
 # ============================================================
 from typing import Any, Dict, List
+import itertools
+import os
+import time
 import uuid
 
+# cheap process-unique window ids (no os.urandom syscall per id)
+_ID_COUNTER = itertools.count()
+_ID_RUN = os.getpid() ^ int(time.time())
+
+
+def _fast_id(prefix: str = "win") -> str:
+    return f"{prefix}-{_ID_RUN:x}-{next(_ID_COUNTER):x}"
+
 
 def _ensure_top_role_in_well(well: Dict[str, Any], default_role="stratigraphy"):
-    tops = well.get("tops") or {}
-    for name, tv in list(tops.items()):
-        if isinstance(tv, dict):
-            if not tv.get("role"):
-                tv["role"] = default_role
-    well["tops"] = tops
+    tops = well.get("tops")
+    if not tops:
+        well["tops"] = tops if isinstance(tops, dict) else {}
+        return
+    # only touch tops that lack a role (none, once migrated)
+    missing = [tv for tv in tops.values() if isinstance(tv, dict) and not tv.get("role")]
+    for tv in missing:
+        tv["role"] = default_role
 
 
 def _ensure_top_role_in_stratigraphy(strat: Dict[str, Any], default_role="stratigraphy"):
-    for name, meta in (strat or {}).items():
-        if isinstance(meta, dict) and not meta.get("role"):
-            meta["role"] = default_role
+    missing = [meta for meta in (strat or {}).values() if isinstance(meta, dict) and not meta.get("role")]
+    for meta in missing:
+        meta["role"] = default_role
 
 
 def _normalize_bitmaps(well: Dict[str, Any]):
@@ -169,14 +213,13 @@ def _normalize_bitmaps(well: Dict[str, Any]):
       well["bitmaps"]["cp001"] ... and also well["cp001"] ...
     Normalize to only well["bitmaps"].
     """
-    bmaps = dict(well.get("bitmaps") or {})
+    bmaps = well.get("bitmaps") or {}
 
-    # absorb any top-level entries that look like bitmap dicts (cp001, cp002, ...)
-    for k in list(well.keys()):
-        if k.startswith("cp") and isinstance(well.get(k), dict) and "path" in well[k]:
-            bmaps.setdefault(k, well[k])
-            # remove duplicate
-            del well[k]
+    # absorb any top-level entries that look like bitmap dicts (cp001, cp002, ...);
+    # collect them in one pass, then move them (removing the duplicate)
+    hits = [k for k, v in well.items() if k[:2] == "cp" and isinstance(v, dict) and "path" in v]
+    for k in hits:
+        bmaps.setdefault(k, well.pop(k))
 
     well["bitmaps"] = bmaps
 
@@ -186,34 +229,95 @@ def _normalize_continuous_logs(well: Dict[str, Any]):
     Ensure each continuous log has matching depth/data lengths.
     Clamp to min length if mismatch.
     """
-    logs = well.get("logs") or {}
-    for ln, ld in list(logs.items()):
+    logs = well.get("logs")
+    if not logs:
+        well["logs"] = logs if isinstance(logs, dict) else {}
+        return
+
+    for name, ld in logs.items():
         if not isinstance(ld, dict):
             continue
-        d = ld.get("depth") or []
-        v = ld.get("data") or []
-        if isinstance(d, list) and isinstance(v, list):
-            n = min(len(d), len(v))
-            if n < len(d) or n < len(v):
-                ld["depth"] = d[:n]
-                ld["data"] = v[:n]
-        logs[ln] = ld
-    well["logs"] = logs
+        d = ld.get("depth")
+        v = ld.get("data")
+        d = [] if d is None else d
+        v = [] if v is None else v
+        # lists and ndarrays alike; slicing an ndarray below is a view, not a copy
+        if not (hasattr(d, "__len__") and hasattr(v, "__len__")) or isinstance(d, (str, dict)) or isinstance(v, (str, dict)):
+            continue
+        nd, nv = len(d), len(v)
+        if nd == nv:
+            continue
+        n = min(nd, nv)
+        LOG.warning("log %r in well %r: depth/data length mismatch (%d/%d), clamping to %d",
+                    name, well.get("name"), nd, nv, n)
+        ld["depth"] = d[:n]
+        ld["data"] = v[:n]
 
 
 def _normalize_discrete_logs(well: Dict[str, Any]):
     """
     Normalize discrete logs to the positive-int code format with a value dictionary.
     """
-    dlogs = well.get("discrete_logs") or {}
-    for ln, ld in list(dlogs.items()):
+    dlogs = well.get("discrete_logs")
+    if not dlogs:
+        well["discrete_logs"] = dlogs if isinstance(dlogs, dict) else {}
+        return
+    # replacing values of existing keys is safe while iterating, no snapshot needed
+    for ln, ld in dlogs.items():
         dlogs[ln] = normalize_discrete_log_definition(ld)
-    well["discrete_logs"] = dlogs
 
 
-def _migrate_window_dict_item_to_spec(wd: Dict[str, Any]) -> Dict[str, Any]:
+def _normalize_well(well: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Whole per-well migration step: fill missing keys, tag the type and
+    normalize bitmaps, logs and top roles. The well is updated in place
+    and returned.
+    """
+    well.setdefault("logs", {})
+    well.setdefault("discrete_logs", {})
+    well.setdefault("tops", {})
+    well.setdefault("bitmaps", {})
+    well.setdefault("facies_intervals", [])
+
+    _normalize_bitmaps(well)
+    _normalize_continuous_logs(well)
+    _normalize_discrete_logs(well)
+    _ensure_top_role_in_well(well, default_role="stratigraphy")
+
+    # also default well reference fields if missing
+    well.setdefault("reference_type", "KB")
+    well.setdefault("reference_depth", 0.0)
+    well.setdefault("total_depth", 0.0)
+    return well
+
+
+# key order and defaults of migrated window specs / their payload;
+# copied per window (payload/panel_settings are always replaced)
+_SPEC_TEMPLATE = {
+    "id": None,
+    "type": "wellpanel",
+    "title": "",
+    "dock_area": None,
+    "tab_group": None,
+    "is_floating": False,
+    "geometry": None,
+    "payload": None,
+}
+_PAYLOAD_TEMPLATE = {
+    "visible": True,
+    "visible_wells": None,
+    "visible_tracks": None,
+    "visible_logs": None,
+    "visible_tops": None,
+    "panel_settings": None,
+}
+
+
+def _migrate_window_dict_item_to_spec(wd: Dict[str, Any], rfc_uuid: bool = False) -> Dict[str, Any]:
     """
     Convert your legacy window_dict item to a PWSWindowSpec-like dict.
+    Windows without an id get a cheap process-unique id, or a uuid4 if
+    rfc_uuid is set.
     """
     wtype = wd.get("type", "WellSection")
     title = wd.get("window_title", wtype)
@@ -229,31 +333,40 @@ def _migrate_window_dict_item_to_spec(wd: Dict[str, Any]) -> Dict[str, Any]:
 
     panel_settings = wd.get("panel_settings") or {}
 
-    spec = {
-        "id": wd.get("id") or str(uuid.uuid4()),
-        "type": "wellpanel" if wtype == "WellSection" else wtype.lower(),
-        "title": title,
-        "dock_area": None,
-        "tab_group": None,
-        "is_floating": bool(wd.get("floating", False)),
-        "geometry": None,
-        "payload": {
-            "visible": bool(wd.get("visible", True)),
-            "visible_wells": wd.get("visible_wells", None),
-            "visible_tracks": wd.get("visible_tracks", None),
-            "visible_logs": wd.get("visible_logs", None),
-            "visible_tops": visible_tops,
-            "panel_settings": panel_settings,
-        },
-    }
+    payload = _PAYLOAD_TEMPLATE.copy()
+    payload["visible"] = bool(wd.get("visible", True))
+    payload["visible_wells"] = wd.get("visible_wells", None)
+    payload["visible_tracks"] = wd.get("visible_tracks", None)
+    payload["visible_logs"] = wd.get("visible_logs", None)
+    payload["visible_tops"] = visible_tops
+    payload["panel_settings"] = panel_settings
+
+    spec = _SPEC_TEMPLATE.copy()
+    spec["id"] = wd.get("id") or (str(uuid.uuid4()) if rfc_uuid else _fast_id())
+    spec["type"] = "wellpanel" if wtype == "WellSection" else wtype.lower()
+    spec["title"] = title
+    spec["is_floating"] = bool(wd.get("floating", False))
+    spec["payload"] = payload
     return spec
 
 
+# primary collections every serialized v2 project (PWSProject.to_dict) carries
+_V2_PROJECT_KEYS = ("all_wells", "all_tracks", "all_stratigraphy", "all_windows")
+
+
 def migrate_legacy_to_project_v2(legacy: Dict[str, Any], project_name: str = "") -> PWSProject:
     """
     Migration tailored to your JSON example:
       - wells/tracks/stratigraphy/metadata/window_dict/ui_layout
     """
+    # a current schema_version alone is not enough: legacy dicts re-tagged
+    # with it still carry "wells"/"window_dict" and need the migration
+    if (isinstance(legacy, dict) and legacy.get("schema_version") == PWSProject.SCHEMA_VERSION
+            and all(k in legacy for k in _V2_PROJECT_KEYS)):
+        LOG.debug("project schema v%s is current, skipping migration", PWSProject.SCHEMA_VERSION)
+        return PWSProject.from_dict(legacy)
+    LOG.debug("migrating legacy project (schema %r)", (legacy or {}).get("schema_version"))
+
     src = dict(legacy or {})
 
     proj = PWSProject()
@@ -271,21 +384,7 @@ def migrate_legacy_to_project_v2(legacy: Dict[str, Any], project_name: str = "")
 
     # Normalize wells content
     for w in proj.all_wells:
-        w.setdefault("logs", {})
-        w.setdefault("discrete_logs", {})
-        w.setdefault("tops", {})
-        w.setdefault("bitmaps", {})
-        w.setdefault("facies_intervals", [])
-
-        _normalize_bitmaps(w)
-        _normalize_continuous_logs(w)
-        _normalize_discrete_logs(w)
-        _ensure_top_role_in_well(w, default_role="stratigraphy")
-
-        # also default well reference fields if missing
-        w.setdefault("reference_type", "KB")
-        w.setdefault("reference_depth", 0.0)
-        w.setdefault("total_depth", 0.0)
+        _normalize_well(w)
 
     # Windows
     win_list = src.get("window_dict") or src.get("windows") or []
@@ -296,23 +395,10 @@ def migrate_legacy_to_project_v2(legacy: Dict[str, Any], project_name: str = "")
 
     # If no windows, create one default wellpanel spec
     if not proj.all_windows:
-        proj.all_windows = [{
-            "id": "main",
-            "type": "wellpanel",
-            "title": "Main Well Panel",
-            "dock_area": "right",
-            "tab_group": "main",
-            "is_floating": False,
-            "geometry": None,
-            "payload": {
-                "visible": True,
-                "visible_wells": None,
-                "visible_tracks": None,
-                "visible_logs": None,
-                "visible_tops": None,
-                "panel_settings": {},
-            },
-        }]
+        spec = _SPEC_TEMPLATE.copy()
+        spec.update(id="main", title="Main Well Panel", dock_area="right", tab_group="main")
+        spec["payload"] = {**_PAYLOAD_TEMPLATE, "panel_settings": {}}
+        proj.all_windows = [spec]
 
     proj.touch_modified()
     return proj
@@ -1,5 +1,11 @@
 from symtable import Class
 
+import functools
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+
 import numpy as np
 from typing import Any, Dict, List, Tuple
 
@@ -65,386 +71,400 @@ class Stratigraphy(Dict):
 
 
 
-
-def create_dummy_data_all():
-    stratigraphy = {
-        "Upper Formation A": {"level": "sequence", "color": "#ff0000"},
-        "Formation A": {"level": "formation", "color": "#ffcc00"},
-        "Sequence 1": {"level": "sequence"},
-        "Member A1": {"level": "member"},
-        "Carboniferous": {"level": "formation", "color": "#000000"},
-        "Lower Formation A": {"level": "sequence", "color": "#0000ff"},
+@dataclass(slots=True)
+class LogTable:
+    """
+    Column-oriented continuous logs of one well: parallel lists of log
+    names, depth arrays and data arrays. Logs recorded on a common depth
+    grid share one depth array.
+    """
+    names: List[str] = field(default_factory=list)
+    depths: List[np.ndarray] = field(default_factory=list)
+    data: List[np.ndarray] = field(default_factory=list)
+
+    @classmethod
+    def from_columns(cls, depth, columns: Dict[str, np.ndarray]) -> "LogTable":
+        """All columns sampled on the same depth grid."""
+        depth = np.asarray(depth)
+        names = list(columns)
+        return cls(names, [depth] * len(names), [np.asarray(columns[n]) for n in names])
+
+    def to_legacy_dict(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """{"GR": {"depth": ..., "data": ...}, ...} as used by the well dicts."""
+        return {n: {"depth": d, "data": v} for n, d, v in zip(self.names, self.depths, self.data)}
+
+
+_INTERVAL_DTYPE = np.dtype([("top", "f4"), ("bot", "f4"), ("facies", "i1")])
+
+# Facies are stored as int8 codes indexing into this tuple
+_FACIES_CATEGORIES = ("Sandstone", "Shale", "Limestone", "Dolomite")
+
+
+def _facies_log(top_depths, bottom_depths, codes):
+    """
+    Discrete facies log backed by one structured interval record array
+    (intervals.top/.bot/.facies) holding int8 category codes. The legacy
+    top_depths/bottom_depths keys are views into its columns; "values"
+    holds the labels looked up from the codes.
+    """
+    intervals = np.rec.fromarrays([top_depths, bottom_depths, codes], dtype=_INTERVAL_DTYPE)
+    return {
+        "intervals": intervals,
+        "top_depths": intervals.top,
+        "bottom_depths": intervals.bot,
+        "codes": intervals.facies,
+        "categories": _FACIES_CATEGORIES,
+        "values": np.asarray(_FACIES_CATEGORIES)[intervals.facies],
     }
 
-    # Define depth intervals and facies
-    top_depths = np.array([1000, 1050, 1100, 1150, 1220, 1280])
-    bottom_depths = np.array([1050, 1100, 1150, 1220, 1280, 1300])
-    facies = np.array(["Sandstone", "Shale", "Limestone", "Shale", "Dolomite", "Shale"])
-
-    # Define colors for facies (for discrete track)
-    facies_colors = {
-        "Sandstone": "#f5d76e",  # yellowish
-        "Shale": "#5c3d2e",      # dark brown
-        "Limestone": "#a0c4ff",  # light blue
-        "Dolomite": "#ffd6a5",   # beige
-    }
 
-    # Example depth intervals (some logs shorter than the well)
-    depth_gr = np.linspace(1050, 1900, 300)
-    depth_cal = np.linspace(1100, 1800, 250)
-    depth_rt = np.linspace(1200, 2000, 350)
-    depth_rhob = np.linspace(1000, 2000, 400)
-    depth_phi = np.linspace(1300, 1950, 200)
+def _readonly(arr):
+    arr.setflags(write=False)
+    return arr
+
+
+# Facies code sequence shared by the sample wells (read-only)
+_FACIES_CODES = _readonly(np.array([0, 1, 2, 1, 3, 1], dtype=np.int8))
+
+# Seeded generator for the synthetic logs: reproducible from run to run, and
+# each dataset takes one batched (well, log, sample) draw from it. The cached
+# datasets use their own generator (_CACHED_SEED) so they do not depend on
+# how many fresh datasets were drawn before them.
+_RNG = np.random.default_rng(0)
+_CACHED_SEED = 1
+_N_SAMPLES = 500
+
+
+# Read-only reference tables shared inside this module; the public
+# functions hand out plain-dict copies (_sample_stratigraphy, _sample_tracks)
+_STRATIGRAPHY = MappingProxyType({
+    "Upper Formation A": MappingProxyType({"level": "sequence", "color": "#ff0000"}),
+    "Formation A": MappingProxyType({"level": "formation", "color": "#ffcc00"}),
+    "Sequence 1": MappingProxyType({"level": "sequence"}),
+    "Member A1": MappingProxyType({"level": "member"}),
+    "Carboniferous": MappingProxyType({"level": "formation", "color": "#000000"}),
+    "Lower Formation A": MappingProxyType({"level": "sequence", "color": "#0000ff"}),
+})
+
+_FACIES_COLORS = MappingProxyType({
+    "Sandstone": "#f5d76e",  # yellowish
+    "Shale": "#5c3d2e",      # dark brown
+    "Limestone": "#a0c4ff",  # light blue
+    "Dolomite": "#ffd6a5",   # beige
+})
+
+# same colors indexed by facies code: _FACIES_COLORS_BY_CODE[codes]
+_FACIES_COLORS_BY_CODE = _readonly(np.array([_FACIES_COLORS[c] for c in _FACIES_CATEGORIES]))
+
+
+_RAW_TRACKS = (
+    {
+        "name": "GR-CAL",
+        "logs": [
+            {
+                "log": "GR",
+                "label": "Gamma Ray (API)",
+                "color": "green",
+                "xlim": (0, 150),
+                "xscale": "linear",
+                "direction": "normal",
+            },
+            {
+                "log": "CAL",
+                "label": "Caliper (in)",
+                "color": "orange",
+                "xlim": (6, 16),
+                "xscale": "linear",
+                "direction": "reverse",
+            },
+        ],
+    },
+    {
+        "name": "RT-RHOB",
+        "logs": [
+            {
+                "log": "RT",
+                "label": "Resistivity (Ω·m)",
+                "color": "red",
+                "xlim": (1, 100),
+                "xscale": "log",
+                "direction": "normal",
+            },
+        ],
+    },
+    {
+        "name": "RHOB-PHI",
+        "logs": [
+            {
+                "log": "RHOB",
+                "label": "Density (g/cc)",
+                "color": "blue",
+                "xlim": (1.9, 2.7),
+                "xscale": "linear",
+                "direction": "reverse",
+            },
+            {
+                "log": "PHI",
+                "label": "Porosity",
+                "color": "purple",
+                "xlim": (0, 0.5),
+                "xscale": "linear",
+                "direction": "normal",
+            },
+        ],
+    },
+    {
+        "name": "Facies",
+        "discrete": {
+            "log": "FACIES",
+            "label": "Facies",
+            "color_map": _FACIES_COLORS,
+            "default_color": "#dddddd",
+        }
+    },
+)
 
-    # Synthetic data
-    gamma_ray = 80 + 20 * np.sin(depth_gr / 100)
-    caliper = 10 + 2 * np.cos(depth_cal / 150)
-    resistivity = 10 * np.exp(-depth_rt / 500) + 2
-    density = 2.3 + 0.1 * np.cos(depth_rhob / 200)
-    porosity = 0.25 + 0.05 * np.sin(depth_phi / 120)
 
-    well1 = {
-        "name": "Well A",
-        "UWI": "56032002322",
-        "x": 654321.0,
-        "y": 5234567.0,
-        "reference_type": "KB",
-        "reference_depth": 0.0,   # KB / reference depth for this well
-        "total_depth": 500.0,      # interval is 950–2450 m
-        "logs": {
-            "GR": {"depth": np.linspace(0, 500, 500), "data": np.random.normal(50, 13, 500)},
-            "CAL": {"depth": np.linspace(000, 500, 500), "data": np.random.normal(10, .2, 500)},
-            "RT": {"depth": np.linspace(000, 500, 500), "data": np.random.normal(10, 5, 500)},
-            "RHOB": {"depth": np.linspace(000, 500, 500), "data": np.random.normal(2.3, .13, 500)},
-            "PHI": {"depth": np.linspace(000, 500, 500), "data": np.random.normal(.25, .03, 500)},
-        },
-        "discrete_logs": {
-            "FACIES": {
-                "top_depths": np.array([0, 50, 100, 150, 200, 250]),
-                "bottom_depths": np.array([50, 100, 150, 200, 250, 300]),
-                "values": np.array(["Sandstone", "Shale", "Limestone", "Shale", "Dolomite", "Shale"]),
-            }
-        },
-        "tops": {
-            "Formation A": {"depth": 200, "level": "formation", "color": "#ffcc00"},
-            "Sequence 1": {"depth": 1400, "level": "sequence"},
-            "Carboniferous": {"depth": 1600, "level": "formation", "color": "#000000"},
-        },
-    }
+def _freeze_track(track):
+    frozen = dict(track)
+    if "logs" in frozen:
+        frozen["logs"] = tuple(MappingProxyType(dict(log)) for log in frozen["logs"])
+    if "discrete" in frozen:
+        frozen["discrete"] = MappingProxyType(dict(frozen["discrete"]))
+    return MappingProxyType(frozen)
 
-    well2 = {
-        "name": "Well B",
-        "UWI": "5603200223",
-        "x": 654700.0,
-        "y": 5234600.0,
-        "reference_type": "RL",
-        "reference_depth": 0.0,  # different KB
-        "total_depth": 1000.0,      # interval is 1010–2510 m
-        "logs": {
-            "GR": {"depth": np.linspace(500, 1000, 500), "data": np.random.normal(50, 13, 500)},
-            "RT": {"depth": np.linspace(500, 1000, 500), "data": np.exp(np.random.normal(1, 5, 500))},
-            "RHOB": {"depth": np.linspace(500, 1000, 500), "data": np.random.normal(2.3, .13, 500)},
-        },
-        "discrete_logs": {
-            "FACIES": {
-                "top_depths": np.array([500, 550, 600, 650, 700, 750]),
-                "bottom_depths": np.array([550, 600, 650, 700, 750, 800]),
-                "values": np.array(["Sandstone", "Shale", "Limestone", "Shale", "Dolomite", "Shale"]),
-            }
-        },
-        "tops": {
-            "Formation A": {"depth": 900, "level": "formation", "color": "#ffcc00"},
-            "Member A1": {"depth": 1350, "level": "member"},
-            "Sequence 1": {"depth": 1600, "level": "sequence"},
-        },
-    }
 
-    well3 = {
-        "name": "Well C",
-        "UWI": "5603200224",
-        "x": 658500.0,
-        "y": 5236600.0,
-        "reference_type": "RL",
+# Read-only track layout; callers get editable copies from _sample_tracks()
+_TRACKS = tuple(_freeze_track(track) for track in _RAW_TRACKS)
+
+
+def _sample_tracks():
+    """Editable copies of the _TRACKS layout (lists of plain dicts)."""
+    tracks = []
+    for track in _TRACKS:
+        track = dict(track)
+        if "logs" in track:
+            track["logs"] = [dict(log) for log in track["logs"]]
+        if "discrete" in track:
+            discrete = dict(track["discrete"])
+            discrete["color_map"] = dict(discrete.get("color_map") or {})
+            track["discrete"] = discrete
+        tracks.append(track)
+    return tracks
+
+
+def _sample_stratigraphy():
+    """Editable plain-dict copy of _STRATIGRAPHY."""
+    return {name: dict(entry) for name, entry in _STRATIGRAPHY.items()}
+
+
+# Synthetic log recipes: (log, mean, sigma, lognormal)
+_FULL_LOGS = (
+    ("GR", 50, 13, False),
+    ("CAL", 10, .2, False),
+    ("RT", 10, 5, False),
+    ("RHOB", 2.3, .13, False),
+    ("PHI", .25, .03, False),
+)
+_SHORT_LOGS = (
+    ("GR", 50, 13, False),
+    ("RT", 1, 5, True),
+    ("RHOB", 2.3, .13, False),
+)
+
+# Sample tops as (name, depth) tables; level and color come from _STRATIGRAPHY
+_TOPS_DTYPE = np.dtype([("name", "U20"), ("depth", "f4")])
+
+
+def _tops_table(*tops):
+    return _readonly(np.array(list(tops), dtype=_TOPS_DTYPE))
+
+
+@dataclass(slots=True, frozen=True)
+class _WellSpec:
+    """Parameters of one synthetic sample well (see _build_well)."""
+    name: str
+    uwi: str
+    x: float
+    y: float
+    reference_type: str
+    depth_top: float
+    depth_bottom: float
+    log_recipes: Tuple[Tuple[str, float, float, bool], ...]
+    tops: np.ndarray
+
+
+_WELL_SPECS_ALL = (
+    _WellSpec("Well A", "56032002322", 654321.0, 5234567.0, "KB", 0, 500, _FULL_LOGS, _tops_table(
+        ("Formation A", 200),
+        ("Sequence 1", 1400),
+        ("Carboniferous", 1600),
+    )),
+    _WellSpec("Well B", "5603200223", 654700.0, 5234600.0, "RL", 500, 1000, _SHORT_LOGS, _tops_table(
+        ("Formation A", 900),
+        ("Member A1", 1350),
+        ("Sequence 1", 1600),
+    )),
+    _WellSpec("Well C", "5603200224", 658500.0, 5236600.0, "RL", 1000, 1500, _SHORT_LOGS, _tops_table(
+        ("Formation A", 1300),
+        ("Member A1", 1350),
+        ("Sequence 1", 1400),
+        ("Carboniferous", 1600),
+    )),
+)
+
+_WELL_SPECS_RAND = (
+    _WellSpec("Well A", "5603200233", 654321.0, 5234567.0, "KB", 0, 500, _FULL_LOGS, _tops_table(
+        ("Formation A", 200),
+        ("Sequence 1", 400),
+        ("Carboniferous", 450),
+    )),
+    _WellSpec("Well B", "5603200231", 654700.0, 5234600.0, "RL", 500, 1000, _SHORT_LOGS, _tops_table(
+        ("Formation A", 600),
+        ("Member A1", 850),
+        ("Sequence 1", 900),
+    )),
+    _WellSpec("Well C", "5603200234", 658500.0, 5236600.0, "RL", 1000, 1500, _SHORT_LOGS, _tops_table(
+        ("Formation A", 1300),
+        ("Member A1", 1350),
+        ("Sequence 1", 1400),
+        ("Carboniferous", 1450),
+    )),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _depth_grid(depth_top, depth_bottom):
+    """Read-only float32 sample depths from depth_top to depth_bottom, shared per range."""
+    step = np.float32((depth_bottom - depth_top) / (_N_SAMPLES - 1))
+    return _readonly(depth_top + np.arange(_N_SAMPLES, dtype=np.float32) * step)
+
+
+def _build_well(spec, z):
+    """One sample well dict from a _WELL_SPECS_* entry and its (log, sample) normal block."""
+    depth_top, tops = spec.depth_top, spec.tops
+    names, means, sigmas, lognormal = zip(*spec.log_recipes)
+    n_logs = len(names)
+    # all logs in one (log, sample) float32 buffer; rows are handed out as views
+    data = np.multiply(z[:n_logs], np.asarray(sigmas, dtype=np.float32)[:, None])
+    data += np.asarray(means, dtype=np.float32)[:, None]
+    lognormal = np.asarray(lognormal)
+    if lognormal.any():
+        data[lognormal] = np.exp(data[lognormal])
+    columns = dict(zip(names, data))
+    # facies intervals: 50 m each, stacked from the top of the logged interval
+    facies_tops = depth_top + 50 * np.arange(len(_FACIES_CODES))
+    return {
+        "name": spec.name,
+        "UWI": spec.uwi,
+        "x": spec.x,
+        "y": spec.y,
+        "reference_type": spec.reference_type,
         "reference_depth": 0.0,
-        "total_depth": 1500.0,  # interval is 950–1750 m
-        "logs": {
-            "GR": {"depth": np.linspace(1000, 1500, 500), "data": np.random.normal(50, 13, 500)},
-            "RT": {"depth": np.linspace(1000, 1500, 500), "data": np.exp(np.random.normal(1, 5, 500))},
-            "RHOB": {"depth": np.linspace(1000, 1500, 500), "data": np.random.normal(2.3, .13, 500)},
-        },
+        "total_depth": float(spec.depth_bottom),
+        "logs": LogTable.from_columns(_depth_grid(depth_top, spec.depth_bottom), columns).to_legacy_dict(),
         "discrete_logs": {
-            "FACIES": {
-                "top_depths": np.array([1000, 1050, 1100, 1150, 1200, 1250]),
-                "bottom_depths": np.array([1050, 1100, 1150, 1200, 1250, 1300]),
-                "values": np.array(["Sandstone", "Shale", "Limestone", "Shale", "Dolomite", "Shale"]),
-            }
+            "FACIES": _facies_log(facies_tops, facies_tops + 50, _FACIES_CODES),
         },
         "tops": {
-            "Formation A": {"depth": 1300, "level": "formation", "color": "#ffcc00"},
-            "Member A1": {"depth": 1350, "level": "member"},
-            "Sequence 1": {"depth": 1400, "level": "sequence"},
-            "Carboniferous": {"depth": 1600, "level": "formation", "color": "#000000"},
+            top_name: {"depth": depth, **_STRATIGRAPHY[top_name]}
+            for top_name, depth in zip(tops["name"].tolist(), tops["depth"].tolist())
         },
     }
 
-    tracks = [
-        {
-            "logs": [
-                {
-                    "log": "GR",
-                    "label": "Gamma Ray (API)",
-                    "color": "green",
-                    "xlim": (0, 150),
-                    "xscale": "linear",
-                    "direction": "normal",
-                },
-                {
-                    "log": "CAL",
-                    "label": "Caliper (in)",
-                    "color": "orange",
-                    "xlim": (6, 16),
-                    "xscale": "linear",
-                    "direction": "reverse",
-                },
-            ],
-        },
-        {
-            "logs": [
-                {
-                    "log": "RT",
-                    "label": "Resistivity (Ω·m)",
-                    "color": "red",
-                    "xlim": (1, 100),
-                    "xscale": "log",
-                    "direction": "normal",
-                },
-            ],
-        },
-        {
-            "logs": [
-                {
-                    "log": "RHOB",
-                    "label": "Density (g/cc)",
-                    "color": "blue",
-                    "xlim": (1.9, 2.7),
-                    "xscale": "linear",
-                    "direction": "reverse",
-                },
-                {
-                    "log": "PHI",
-                    "label": "Porosity",
-                    "color": "purple",
-                    "xlim": (0, 0.5),
-                    "xscale": "linear",
-                    "direction": "normal",
-                },
-            ],
-        },
-        {
-            "discrete": {
-                "log": "FACIES",
-                "label": "Facies",
-                "color_map": facies_colors,
-                "default_color": "#dddddd",
-            }
-        },
-    ]
 
-    wells = [well1, well2, well3]
+def _generate_wells(specs, rng=None):
+    # one standard-normal block for all wells and logs, sliced per well
+    rng = _RNG if rng is None else rng
+    n_logs = max(len(spec.log_recipes) for spec in specs)
+    z = rng.standard_normal((len(specs), n_logs, _N_SAMPLES), dtype=np.float32)
+    return [_build_well(spec, z[i]) for i, spec in enumerate(specs)]
+
+
+def create_dummy_data_all(cached=False):
+    """
+    Three sample wells with logs, facies and tops, plus tracks and
+    stratigraphy. Every call returns new, independent and editable data.
+    With cached=True the wells are generated once and shared between such
+    calls (treat them as read-only); tracks and stratigraphy are always
+    fresh copies.
+    """
+    wells = _cached_dummy_data_all() if cached else _generate_dummy_data_all()
+    return wells, _sample_tracks(), _sample_stratigraphy()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_dummy_data_all():
+    return _generate_dummy_data_all(np.random.default_rng(_CACHED_SEED))
+
+
+def _blob_encode(obj, arrays):
+    """Replace ndarrays by {"__array__": key} refs, collecting them in arrays."""
+    if isinstance(obj, np.ndarray):
+        key = f"a{len(arrays)}"
+        arrays[key] = obj
+        return {"__array__": key}
+    if isinstance(obj, (dict, MappingProxyType)):
+        return {k: _blob_encode(v, arrays) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_blob_encode(v, arrays) for v in obj]
+    return obj
+
+
+def _blob_decode(obj, arrays):
+    if isinstance(obj, dict):
+        key = obj.get("__array__")
+        if key is not None and len(obj) == 1:
+            return arrays[key]
+        return {k: _blob_decode(v, arrays) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_blob_decode(v, arrays) for v in obj]
+    return obj
+
+
+def export_sample_blob(path_stem, data=None):
+    """
+    Write (wells, tracks, stratigraphy) as a <stem>.json structure plus a
+    <stem>.npz holding all arrays, for load_sample_blob().
+    """
+    stem = Path(path_stem)
+    arrays = {}
+    meta = _blob_encode(list(data or create_dummy_data_all()), arrays)
+    np.savez(stem.with_suffix(".npz"), **arrays)
+    stem.with_suffix(".json").write_text(json.dumps(meta), encoding="utf-8")
+
+
+def load_sample_blob(path_stem):
+    """Load a dataset written by export_sample_blob() without rebuilding it in Python."""
+    stem = Path(path_stem)
+    meta = json.loads(stem.with_suffix(".json").read_bytes())
+    with np.load(stem.with_suffix(".npz")) as npz:
+        arrays = {key: npz[key] for key in npz.files}
+    wells, tracks, stratigraphy = _blob_decode(meta, arrays)
     return wells, tracks, stratigraphy
 
-def create_dummy_data_rand():
-    stratigraphy = {
-        "Upper Formation A": {"level": "sequence", "color": "#ff0000"},
-        "Formation A": {"level": "formation", "color": "#ffcc00"},
-        "Sequence 1": {"level": "sequence"},
-        "Member A1": {"level": "member"},
-        "Carboniferous": {"level": "formation", "color": "#000000"},
-        "Lower Formation A": {"level": "sequence", "color": "#0000ff"},
-    }
-
-    # Define depth intervals and facies
-    top_depths = np.array([1000, 1050, 1100, 1150, 1220, 1280])
-    bottom_depths = np.array([1050, 1100, 1150, 1220, 1280, 1300])
-    facies = np.array(["Sandstone", "Shale", "Limestone", "Shale", "Dolomite", "Shale"])
-
-    # Define colors for facies (for discrete track)
-    facies_colors = {
-        "Sandstone": "#f5d76e",  # yellowish
-        "Shale": "#5c3d2e",      # dark brown
-        "Limestone": "#a0c4ff",  # light blue
-        "Dolomite": "#ffd6a5",   # beige
-    }
-
-    # Example depth intervals (some logs shorter than the well)
-    depth_gr = np.linspace(1050, 1900, 300)
-    depth_cal = np.linspace(1100, 1800, 250)
-    depth_rt = np.linspace(1200, 2000, 350)
-    depth_rhob = np.linspace(1000, 2000, 400)
-    depth_phi = np.linspace(1300, 1950, 200)
-
-    # Synthetic data
-    gamma_ray = 80 + 20 * np.sin(depth_gr / 100)
-    caliper = 10 + 2 * np.cos(depth_cal / 150)
-    resistivity = 10 * np.exp(-depth_rt / 500) + 2
-    density = 2.3 + 0.1 * np.cos(depth_rhob / 200)
-    porosity = 0.25 + 0.05 * np.sin(depth_phi / 120)
 
-    well1 = {
-        "name": "Well A",
-        "UWI": "5603200233",
-        "x": 654321.0,
-        "y": 5234567.0,
-        "reference_type": "KB",
-        "reference_depth": 0.0,   # KB / reference depth for this well
-        "total_depth": 500.0,      # interval is 950–2450 m
-        "logs": {
-            "GR": {"depth": np.linspace(0, 500, 500), "data": np.random.normal(50, 13, 500)},
-            "CAL": {"depth": np.linspace(000, 500, 500), "data": np.random.normal(10, .2, 500)},
-            "RT": {"depth": np.linspace(000, 500, 500), "data": np.random.normal(10, 5, 500)},
-            "RHOB": {"depth": np.linspace(000, 500, 500), "data": np.random.normal(2.3, .13, 500)},
-            "PHI": {"depth": np.linspace(000, 500, 500), "data": np.random.normal(.25, .03, 500)},
-        },
-        "discrete_logs": {
-            "FACIES": {
-                "top_depths": np.array([0, 50, 100, 150, 200, 250]),
-                "bottom_depths": np.array([50, 100, 150, 200, 250, 300]),
-                "values": np.array(["Sandstone", "Shale", "Limestone", "Shale", "Dolomite", "Shale"]),
-            }
-        },
-        "tops": {
-            "Formation A": {"depth": 200, "level": "formation", "color": "#ffcc00"},
-            "Sequence 1": {"depth": 400, "level": "sequence"},
-            "Carboniferous": {"depth": 450, "level": "formation", "color": "#000000"},
-        },
-    }
+def _generate_dummy_data_all(rng=None):
+    return _generate_wells(_WELL_SPECS_ALL, rng)
 
-    well2 = {
-        "name": "Well B",
-        "UWI": "5603200231",
-        "x": 654700.0,
-        "y": 5234600.0,
-        "reference_type": "RL",
-        "reference_depth": 0.0,  # different KB
-        "total_depth": 1000.0,      # interval is 1010–2510 m
-        "logs": {
-            "GR": {"depth": np.linspace(500, 1000, 500), "data": np.random.normal(50, 13, 500)},
-            "RT": {"depth": np.linspace(500, 1000, 500), "data": np.exp(np.random.normal(1, 5, 500))},
-            "RHOB": {"depth": np.linspace(500, 1000, 500), "data": np.random.normal(2.3, .13, 500)},
-        },
-        "discrete_logs": {
-            "FACIES": {
-                "top_depths": np.array([500, 550, 600, 650, 700, 750]),
-                "bottom_depths": np.array([550, 600, 650, 700, 750, 800]),
-                "values": np.array(["Sandstone", "Shale", "Limestone", "Shale", "Dolomite", "Shale"]),
-            }
-        },
-        "tops": {
-            "Formation A": {"depth": 600, "level": "formation", "color": "#ffcc00"},
-            "Member A1": {"depth": 850, "level": "member"},
-            "Sequence 1": {"depth": 900, "level": "sequence"},
-        },
-    }
 
-    well3 = {
-        "name": "Well C",
-        "UWI": "5603200234",
-        "x": 658500.0,
-        "y": 5236600.0,
-        "reference_type": "RL",
-        "reference_depth": 0.0,
+def create_dummy_data_rand(cached=False):
+    """
+    Like create_dummy_data_all, with other UWIs and tops (_WELL_SPECS_RAND).
+    Every call is a new, independent draw unless cached=True asks for the
+    shared, read-only wells.
+    """
+    wells = _cached_dummy_data_rand() if cached else _generate_dummy_data_rand()
+    return wells, _sample_tracks(), _sample_stratigraphy()
 
-        "total_depth": 1500.0,  # interval is 950–1750 m
-        "logs": {
-            "GR": {"depth": np.linspace(1000, 1500, 500), "data": np.random.normal(50, 13, 500)},
-            "RT": {"depth": np.linspace(1000, 1500, 500), "data": np.exp(np.random.normal(1, 5, 500))},
-            "RHOB": {"depth": np.linspace(1000, 1500, 500), "data": np.random.normal(2.3, .13, 500)},
-        },
-        "discrete_logs": {
-            "FACIES": {
-                "top_depths": np.array([1000, 1050, 1100, 1150, 1200, 1250]),
-                "bottom_depths": np.array([1050, 1100, 1150, 1200, 1250, 1300]),
-                "values": np.array(["Sandstone", "Shale", "Limestone", "Shale", "Dolomite", "Shale"]),
-            }
-        },
-        "tops": {
-            "Formation A": {"depth": 1300, "level": "formation", "color": "#ffcc00"},
-            "Member A1": {"depth": 1350, "level": "member"},
-            "Sequence 1": {"depth": 1400, "level": "sequence"},
-            "Carboniferous": {"depth": 1450, "level": "formation", "color": "#000000"},
-        },
-    }
 
-    tracks = [
-        {
-            "name": "GR-CAL",
-            "logs": [
-                {
-                    "log": "GR",
-                    "label": "Gamma Ray (API)",
-                    "color": "green",
-                    "xlim": (0, 150),
-                    "xscale": "linear",
-                    "direction": "normal",
-                },
-                {
-                    "log": "CAL",
-                    "label": "Caliper (in)",
-                    "color": "orange",
-                    "xlim": (6, 16),
-                    "xscale": "linear",
-                    "direction": "reverse",
-                },
-            ],
-        },
-        {
-            "name": "RT-RHOB",
-            "logs": [
-                {
-                    "log": "RT",
-                    "label": "Resistivity (Ω·m)",
-                    "color": "red",
-                    "xlim": (1, 100),
-                    "xscale": "log",
-                    "direction": "normal",
-                },
-            ],
-        },
-        {
-            "name": "RHOB-PHI",
-            "logs": [
-                {
-                    "log": "RHOB",
-                    "label": "Density (g/cc)",
-                    "color": "blue",
-                    "xlim": (1.9, 2.7),
-                    "xscale": "linear",
-                    "direction": "reverse",
-                },
-                {
-                    "log": "PHI",
-                    "label": "Porosity",
-                    "color": "purple",
-                    "xlim": (0, 0.5),
-                    "xscale": "linear",
-                    "direction": "normal",
-                },
-            ],
-        },
-        {
-            "name": "Facies",
-            "discrete": {
-                "log": "FACIES",
-                "label": "Facies",
-                "color_map": facies_colors,
-                "default_color": "#dddddd",
-            }
-        },
-    ]
+@functools.lru_cache(maxsize=1)
+def _cached_dummy_data_rand():
+    return _generate_dummy_data_rand(np.random.default_rng(_CACHED_SEED))
 
-    wells = [well1, well2, well3]
-    return wells, tracks, stratigraphy
 
+def _generate_dummy_data_rand(rng=None):
+    return _generate_wells(_WELL_SPECS_RAND, rng)
 
 
 def create_dummy_data_0():
@@ -455,16 +475,12 @@ def create_dummy_data_0():
     wells.test_class()
     return wells, tracks, stratigraphy
 
-def create_top_only_Data ():
-
-    stratigraphy = {
-        "Formation A": {"level": "formation", "color": "#ffcc00"},
-        "Sequence 1": { "level": "sequence"},
-        "Member A1": {"level": "member"},
-        "Carboniferous": {"level": "formation", "color": "#000000"},
-    }
-
-
+def _top_only_wells():
+    """
+    Three log-less wells with tops. "Well A" is listed twice (RL and GF
+    reference); the second copy is derived from the first and only adds
+    "Member A1". Fresh dicts per call, callers edit the tops.
+    """
     well1 = {
         "name": "Well A",
         "UWI": "5603200234",
@@ -496,22 +512,30 @@ def create_top_only_Data ():
 
     }
 
+    tops1 = well1["tops"]
     well3 = {
-        "name": "Well A",
-        "UWI": "5603200234",
-        "x": 658500.0,
-        "y": 5236600.0,
+        **well1,
         "reference_type": "GF",
-        "reference_depth": 950.0,  # KB / reference depth for this well
-        "total_depth": 800.0,  # so interval is 950–1750 m
         "tops": {
-            "Formation A": {"depth": 1100, "level": "formation", "color": "#ffcc00"},
+            "Formation A": dict(tops1["Formation A"]),
             "Member A1": {"depth": 1350, "level": "member"},
-            "Sequence 1": {"depth": 1400, "level": "sequence"},
-            "Carboniferous": {"depth": 1600, "level": "formation", "color": "#000000"},
+            "Sequence 1": dict(tops1["Sequence 1"]),
+            "Carboniferous": dict(tops1["Carboniferous"]),
         }}
 
-    wells = [well1, well2, well3]
+    return [well1, well2, well3]
+
+
+def create_top_only_Data ():
+
+    stratigraphy = {
+        "Formation A": {"level": "formation", "color": "#ffcc00"},
+        "Sequence 1": { "level": "sequence"},
+        "Member A1": {"level": "member"},
+        "Carboniferous": {"level": "formation", "color": "#000000"},
+    }
+
+    wells = _top_only_wells()
     tracks = [
         {
             "logs": [
@@ -523,53 +547,7 @@ def create_top_only_Data ():
     return wells, tracks
 
 def create_dummy_data_wells_only():
-    well1 = {
-        "name": "Well A",
-        "UWI": "5603200234",
-        "x": 658500.0,
-        "y": 5236600.0,
-        "reference_type": "RL",
-        "reference_depth": 950.0,  # KB / reference depth for this well
-        "total_depth": 800.0,  # so interval is 950–1750 m
-        "tops": {
-            "Formation A": {"depth": 1100, "level": "formation", "color": "#ffcc00"},
-
-            "Sequence 1": {"depth": 1400, "level": "sequence"},
-            "Carboniferous": {"depth": 1600, "level": "formation", "color": "#000000"},
-        }}
-
-    well2 = {
-        "name": "Well B",
-        "UWI": "5603200231",
-        "x": 658500.0,
-        "y": 5236600.0,
-        "reference_type": "KB",
-        "reference_depth": 1010.0,  # different KB
-        "total_depth": 1000.0,  # different TD -> 1010–2010 m
-        "tops": {
-            "Formation A": {"depth": 1300, "level": "formation", "color": "#ffcc00"},
-            "Member A1": {"depth": 1350, "level": "member"},
-            "Sequence 1": {"depth": 1600, "level": "sequence"},
-        }
-
-    }
-
-    well3 = {
-        "name": "Well A",
-        "UWI": "5603200234",
-        "x": 658500.0,
-        "y": 5236600.0,
-        "reference_type": "GF",
-        "reference_depth": 950.0,  # KB / reference depth for this well
-        "total_depth": 800.0,  # so interval is 950–1750 m
-        "tops": {
-            "Formation A": {"depth": 1100, "level": "formation", "color": "#ffcc00"},
-            "Member A1": {"depth": 1350, "level": "member"},
-            "Sequence 1": {"depth": 1400, "level": "sequence"},
-            "Carboniferous": {"depth": 1600, "level": "formation", "color": "#000000"},
-        }}
-
-    wells = [well1, well2, well3]
+    wells = _top_only_wells()
     tracks = []
     stratigraphy = []
     return wells, tracks, stratigraphy
@@ -1,65 +1,94 @@
+import functools
+import math
 import sys
-import numpy as np
-
-from PySide6.QtWidgets import (
-    QApplication,
-    QMainWindow,
-    QScrollArea,
-    QSizePolicy,
-)
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
-from multi_wells_panel import draw_multi_wells_panel_on_figure
+
 from sample_data import create_dummy_data
 
+# upper bound for the rendered figure's RGBA buffer
+_MAX_CANVAS_MB = 24
+
 
 # -------------------------------------------------------------------
 # Scrollable window with fixed-size Matplotlib figure
 # -------------------------------------------------------------------
-class WellLogScrollWindow(QMainWindow):
-    def __init__(self, wells, tracks, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Multi-Well Log Panel (Fixed Figure + Scrollable Window)")
-
-        # Create a Matplotlib Figure
-        # figsize doesn't control the *widget* size, but DPI * figsize = px
-        self.fig = Figure(figsize=(16, 9), dpi=100)  # internal logical size
-        self.canvas = FigureCanvas(self.fig)
-
-        # Make the canvas a fixed pixel size (e.g. 1600x900 px)
-        self.canvas.setFixedSize(1600, 900)
-        self.canvas.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-
-        wells, tracks = create_dummy_data()
-
-        # Draw your well logs onto this figure
-        draw_multi_wells_panel_on_figure(
-            self.fig,
-            wells,
-            tracks,
-            suptitle="Multi-Well Panel (Fixed Figure Size)",
-            well_gap_factor=3.0,
-        )
-        self.canvas.draw()
-
-        # Put the canvas inside a QScrollArea
-        scroll = QScrollArea(self)
-        scroll.setWidget(self.canvas)
-        scroll.setWidgetResizable(False)  # keep canvas size fixed
-        self.setCentralWidget(scroll)
-
-        # Now the window can be resized independently of the figure
-        self.resize(1000, 700)  # initial window size
+@functools.lru_cache(maxsize=None)
+def _window_class():
+    """
+    Define WellLogScrollWindow on first use, so importing this module does
+    not pull in Qt and Matplotlib.
+    """
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QImage, QPixmap
+    from PySide6.QtWidgets import QLabel, QMainWindow, QScrollArea, QSizePolicy
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from multi_wells_panel import draw_multi_wells_panel_on_figure
+
+    class WellLogScrollWindow(QMainWindow):
+        def __init__(self, wells, tracks, parent=None):
+            super().__init__(parent)
+            self.setWindowTitle("Multi-Well Log Panel (Fixed Figure + Scrollable Window)")
+
+            # Create a Matplotlib Figure
+            # figsize doesn't control the *widget* size, but DPI * figsize = px;
+            # render straight at device pixels so HiDPI screens need no resample
+            dpr = self.devicePixelRatioF()
+            # cap the RGBA backing store; very dense screens get a slightly softer image
+            if 1600 * 900 * 4 * dpr * dpr > _MAX_CANVAS_MB * 1e6:
+                dpr = math.sqrt(_MAX_CANVAS_MB * 1e6 / (1600 * 900 * 4))
+            self.fig = Figure(figsize=(16, 9), dpi=100 * dpr)  # 1600x900 logical px
+            # the figure is static: render it off-screen with Agg and show the bitmap
+            self.canvas = FigureCanvasAgg(self.fig)
+
+            # Draw your well logs onto this figure
+            draw_multi_wells_panel_on_figure(
+                self.fig,
+                wells,
+                tracks,
+                suptitle="Multi-Well Panel (Fixed Figure Size)",
+                well_gap_factor=3.0,
+            )
+            self.canvas.draw()
+
+            # Make the label a fixed logical pixel size (1600x900 px)
+            w, h = self.canvas.get_width_height()
+            image = QImage(self.canvas.buffer_rgba(), w, h, QImage.Format_RGBA8888)
+            pixmap = QPixmap.fromImage(image)  # copies the buffer
+            pixmap.setDevicePixelRatio(dpr)
+            self.label = QLabel()
+            self.label.setPixmap(pixmap)
+            self.label.setAttribute(Qt.WA_OpaquePaintEvent, True)
+            self.label.setFixedSize(1600, 900)
+            self.label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+
+            # Put the image inside a QScrollArea
+            scroll = QScrollArea(self)
+            scroll.setWidget(self.label)
+            scroll.setWidgetResizable(False)  # keep image size fixed
+            self.setCentralWidget(scroll)
+
+            # Now the window can be resized independently of the figure
+            self.resize(1000, 700)  # initial window size
+
+    return WellLogScrollWindow
+
+
+def __getattr__(name):
+    if name == "WellLogScrollWindow":
+        return _window_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # -------------------------------------------------------------------
 # Main
 # -------------------------------------------------------------------
 if __name__ == "__main__":
+    from PySide6.QtWidgets import QApplication
+
     wells, tracks = create_dummy_data()
 
     app = QApplication(sys.argv)
-    win = WellLogScrollWindow(wells, tracks)
+    win = _window_class()(wells, tracks)
     win.show()
     sys.exit(app.exec_())
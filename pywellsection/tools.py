@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 def _is_latlon(x, y) -> bool:
     """Heuristic: looks like degrees."""
     try:
@@ -17,6 +19,14 @@ def _haversine_m(lon1, lat1, lon2, lat2) -> float:
     a = math.sin(dphi/2)**2 + math.cos(phi1)*math.cos(phi2)*math.sin(dlmb/2)**2
     return 2 * R * math.asin(math.sqrt(a))
 
+def _haversine_m_vec(lon1, lat1, lon2, lat2) -> np.ndarray:
+    """Array version of _haversine_m (broadcasts like any numpy ufunc)."""
+    lon1, lat1, lon2, lat2 = map(np.radians, (lon1, lat1, lon2, lat2))
+    dphi = lat2 - lat1
+    dlmb = lon2 - lon1
+    a = np.sin(dphi/2)**2 + np.cos(lat1)*np.cos(lat2)*np.sin(dlmb/2)**2
+    return 2 * 6371000.0 * np.arcsin(np.sqrt(a))
+
 def _well_distance_m(w1: dict, w2: dict) -> float | None:
     """
     Returns distance in meters between w1 and w2 using:
@@ -50,4 +60,57 @@ def _well_distance_m(w1: dict, w2: dict) -> float | None:
         except Exception:
             return None
 
-    return None
\ No newline at end of file
+    return None
+
+def _float_or_nan(v) -> float:
+    try:
+        return float(v)
+    except Exception:
+        return math.nan
+
+def _well_coords(wells: list[dict]) -> dict[str, np.ndarray]:
+    """Per-well coordinate columns used by the vectorized distance helpers."""
+    xy_given = np.array([w.get("x") is not None and w.get("y") is not None for w in wells], dtype=bool)
+    x = np.array([_float_or_nan(w.get("x")) for w in wells], dtype=float)
+    y = np.array([_float_or_nan(w.get("y")) for w in wells], dtype=float)
+    lon = np.array([_float_or_nan(w.get("longitude")) for w in wells], dtype=float)
+    lat = np.array([_float_or_nan(w.get("latitude")) for w in wells], dtype=float)
+    with np.errstate(invalid="ignore"):
+        xy_deg = (np.abs(x) <= 180) & (np.abs(y) <= 90)
+    return {
+        "xy_given": xy_given,
+        "xy_ok": ~(np.isnan(x) | np.isnan(y)),
+        "xy_deg": xy_deg,
+        "x": x, "y": y,
+        "ll_ok": ~(np.isnan(lon) | np.isnan(lat)),
+        "lon": lon, "lat": lat,
+    }
+
+def _pair_distances_m(c: dict[str, np.ndarray], i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """
+    Distances between wells i and j (index arrays, broadcast against each other)
+    with the same rules as _well_distance_m; NaN where it would return None.
+    """
+    use_xy = c["xy_given"][i] & c["xy_given"][j]
+    xy_ok = use_xy & c["xy_ok"][i] & c["xy_ok"][j]
+    xy_deg = xy_ok & c["xy_deg"][i] & c["xy_deg"][j]
+    ll_ok = ~use_xy & c["ll_ok"][i] & c["ll_ok"][j]
+
+    x1, y1, x2, y2 = c["x"][i], c["y"][i], c["x"][j], c["y"][j]
+    with np.errstate(invalid="ignore"):
+        d_xy = np.where(xy_deg, _haversine_m_vec(x1, y1, x2, y2), np.hypot(x2 - x1, y2 - y1))
+        d_ll = _haversine_m_vec(c["lon"][i], c["lat"][i], c["lon"][j], c["lat"][j])
+    return np.where(xy_ok, d_xy, np.where(ll_ok, d_ll, np.nan))
+
+def wells_distance_matrix_m(wells: list[dict]) -> np.ndarray:
+    """N x N matrix of well distances in meters (NaN where no coordinates match up)."""
+    idx = np.arange(len(wells))
+    return _pair_distances_m(_well_coords(wells), idx[:, None], idx[None, :])
+
+def _adjacent_well_distances_m(wells: list[dict]) -> list[float | None]:
+    """Distances between consecutive wells, same values as calling _well_distance_m pairwise."""
+    if len(wells) < 2:
+        return []
+    idx = np.arange(len(wells) - 1)
+    d = _pair_distances_m(_well_coords(wells), idx, idx + 1)
+    return [None if math.isnan(v) else v for v in d.tolist()]
@@ -18,172 +18,151 @@ LEAF_ALWAYS_CHECKABLE = 1
 LEAF_NEVER_CHECKABLE = 2
 
 _CHECK_POLICY_ROLE = QtCore.Qt.UserRole + 200
+# pending (not yet created) structural child labels of a tree item
+_LAZY_CHILDREN_ROLE = QtCore.Qt.UserRole + 201
+
+# checkable folder node: tristate so checking it checks/unchecks children
+_FOLDER_FLAGS = Qt.ItemIsUserCheckable | Qt.ItemIsAutoTristate | Qt.ItemIsSelectable | Qt.ItemIsEnabled
+_UNCHECKED = Qt.Unchecked
+
+
+def _make_folder_item(label, parent=None):
+    """Unchecked tristate folder item, added to parent (item) if given."""
+    it = QTreeWidgetItem([label])
+    it.setFlags(it.flags() | _FOLDER_FLAGS)
+    it.setCheckState(0, _UNCHECKED)
+    if parent is not None:
+        parent.addChild(it)
+    return it
+
+
+# checkable leaf (log / bitmap name) under a folder
+_LEAF_FLAGS = Qt.ItemIsUserCheckable | Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+
+def repopulate_checkable_folder(root, names):
+    """
+    Replace the children of folder item root by one checkable leaf per name
+    (UserRole = name). Check states of names that were there before are kept;
+    with no previous selection every leaf starts checked. The leaves are built
+    detached and attached with a single addChildren() call.
+    """
+    user_role = Qt.UserRole
+    checked, unchecked = Qt.Checked, Qt.Unchecked
+
+    prev_selected = set()
+    for i in range(root.childCount()):
+        it = root.child(i)
+        if it.checkState(0) == checked:
+            prev_selected.add(it.data(0, user_role))
+    root.takeChildren()
+
+    items = []
+    for name in names:
+        it = QTreeWidgetItem([name])
+        it.setFlags(it.flags() | _LEAF_FLAGS)
+        it.setData(0, user_role, name)
+        it.setCheckState(0, checked if (not prev_selected or name in prev_selected) else unchecked)
+        items.append(it)
+    root.addChildren(items)
+
+
+def set_lazy_children(item, labels):
+    """
+    Give item structural (non-checkable) child leaves that are only created
+    when the item is first expanded (see fetch_lazy_children). The expand
+    arrow is shown right away.
+    """
+    labels = [lb for lb in labels if lb]
+    item.setData(0, _LAZY_CHILDREN_ROLE, labels or None)
+    item.setChildIndicatorPolicy(
+        QTreeWidgetItem.ShowIndicator if labels else QTreeWidgetItem.DontShowIndicatorWhenChildless
+    )
+
+
+def fetch_lazy_children(item):
+    """itemExpanded slot: create the pending children of item, once."""
+    labels = item.data(0, _LAZY_CHILDREN_ROLE)
+    if not labels:
+        return
+    tree = item.treeWidget()
+    if tree is not None:
+        tree.blockSignals(True)
+    try:
+        item.setData(0, _LAZY_CHILDREN_ROLE, None)
+        children = []
+        for label in labels:
+            child = QTreeWidgetItem([label])
+            child.setFlags(child.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled)
+            children.append(child)
+        item.addChildren(children)
+        item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicatorWhenChildless)
+    finally:
+        if tree is not None:
+            tree.blockSignals(False)
+
 
 def setup_window_tree(self):
     self.window_tree = QTreeWidget(self)
     self.window_tree.setHeaderHidden(True)
-    self.window_tree.itemChanged.connect(self._on_window_item_changed)
     self.window_tree.setContextMenuPolicy(Qt.CustomContextMenu)
     self.window_tree.customContextMenuRequested.connect(self._on_window_tree_context_menu)
 
     # 👇 create the folder item once
-    self.window_root = QTreeWidgetItem(["Windows"])
-    # tristate so checking it checks/unchecks children
-    self.window_root.setFlags(
-        self.window_root.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-    self.window_root.setCheckState(0, Qt.Unchecked)
+    self.window_root = _make_folder_item("Windows")
     self.window_tree.addTopLevelItem(self.window_root)
 
+    # connect only after the initial items exist -> no itemChanged calls while building
+    self.window_tree.itemChanged.connect(self._on_window_item_changed)
+
 def setup_well_widget_tree(self):
     ### --- Define the Input Tree ###
     self.well_tree = QTreeWidget(self)
     self.well_tree.setHeaderHidden(True)
-    self.well_tree.itemChanged.connect(self._on_well_tree_item_changed)
     self.well_tree.setContextMenuPolicy(Qt.CustomContextMenu)
     self.well_tree.customContextMenuRequested.connect(self._on_tree_context_menu)
 
     LOG.info("Setting up well tree")
 
+    # build the folders detached from the view, then hand them over in one batch
+    self.well_tree.setUpdatesEnabled(False)
+    self.well_tree.blockSignals(True)
 
-    # 👇 create the folder item once
-    self.well_root_item = QTreeWidgetItem(["Wells"])
-    # tristate so checking it checks/unchecks children
-    self.well_root_item.setFlags(
-        self.well_root_item.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-
-    self.well_root_item.setCheckState(0, Qt.Unchecked)
-    self.well_tree.addTopLevelItem(self.well_root_item)
-
-    self.well_tops_folder = QTreeWidgetItem(["Well Tops"])
-    # tristate so checking it checks/unchecks children
-    self.well_tops_folder.setFlags(
-        self.well_tops_folder.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-
-    self.well_tops_folder.setCheckState(0, Qt.Unchecked)
-    self.well_tree.addTopLevelItem(self.well_tops_folder)
-
-    self.stratigraphy_root = QTreeWidgetItem(["Stratigraphy"])
-    self.stratigraphy_root.setFlags(
-        self.stratigraphy_root.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-    self.stratigraphy_root.setCheckState(0, Qt.Unchecked)
-    self.well_tops_folder.addChild(self.stratigraphy_root)
-
-    self.faults_root = QTreeWidgetItem(["Faults"])
-    self.faults_root.setFlags(
-        self.faults_root.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-    self.faults_root.setCheckState(0, Qt.Unchecked)
-    self.well_tops_folder.addChild(self.faults_root)
-
-    self.other_root = QTreeWidgetItem(["Other"])
-    self.other_root.setFlags(
-        self.other_root.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-    self.other_root.setCheckState(0, Qt.Unchecked)
-    self.well_tops_folder.addChild(self.other_root)
-
-    self.well_logs_folder = QTreeWidgetItem(["Logs"])
-    # tristate so checking it checks/unchecks children
-    self.well_logs_folder.setFlags(
-        self.well_logs_folder.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-
-    self.well_logs_folder.setCheckState(0, Qt.Unchecked)
-#    self.well_root_item.addChild(self.well_logs_folder)
-    self.well_tree.addTopLevelItem(self.well_logs_folder)
-
-    self.continous_logs_folder = QTreeWidgetItem(["Continous Logs"])
-    self.continous_logs_folder.setFlags(
-        self.continous_logs_folder.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-    self.continous_logs_folder.setCheckState(0, Qt.Unchecked)
-    self.well_logs_folder.addChild(self.continous_logs_folder)
-
-    self.discrete_logs_folder = QTreeWidgetItem(["Discrete Logs"])
-    self.discrete_logs_folder.setFlags(
-        self.discrete_logs_folder.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-    self.discrete_logs_folder.setCheckState(0, Qt.Unchecked)
-    self.well_logs_folder.addChild(self.discrete_logs_folder)
-
-    self.bitmaps_folder = QTreeWidgetItem(["Bitmaps"])
-    self.bitmaps_folder.setFlags(
-        self.bitmaps_folder.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-    self.bitmaps_folder.setCheckState(0, Qt.Unchecked)
-    self.well_logs_folder.addChild(self.bitmaps_folder)
+    # 👇 create the folder items once
+    self.well_root_item = _make_folder_item("Wells")
 
+    self.well_tops_folder = _make_folder_item("Well Tops")
+    self.stratigraphy_root = _make_folder_item("Stratigraphy")
+    self.faults_root = _make_folder_item("Faults")
+    self.other_root = _make_folder_item("Other")
 
+    self.well_logs_folder = _make_folder_item("Logs")
+    self.continous_logs_folder = _make_folder_item("Continous Logs")
+    self.discrete_logs_folder = _make_folder_item("Discrete Logs")
+    self.bitmaps_folder = _make_folder_item("Bitmaps")
 
     # --- Folder: Tracks (structure only, not necessarily checkable) ---
-    self.track_root_item = QTreeWidgetItem(["Tracks"])
-    # structure only -> no checkboxes needed, but selectable/enabled
-    self.track_root_item.setFlags(
-        self.track_root_item.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-    self.track_root_item.setCheckState(0, Qt.Unchecked)
-    self.well_tree.addTopLevelItem(self.track_root_item)
+    self.track_root_item = _make_folder_item("Tracks")
 
     # --- Folder: stratigraphy (structure only, not necessarily checkable) ---
-    self.stratigraphy_root_item = QTreeWidgetItem(["Stratigraphic column"])
-    # structure only -> no checkboxes needed, but selectable/enabled
-    self.stratigraphy_root_item.setFlags(
-        self.stratigraphy_root_item.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-    self.stratigraphy_root_item.setCheckState(0, Qt.Unchecked)
-    self.well_tree.addTopLevelItem(self.stratigraphy_root_item)
+    self.stratigraphy_root_item = _make_folder_item("Stratigraphic column")
+
+    self.well_tops_folder.addChildren([self.stratigraphy_root, self.faults_root, self.other_root])
+    self.well_logs_folder.addChildren([self.continous_logs_folder, self.discrete_logs_folder, self.bitmaps_folder])
+    self.well_tree.addTopLevelItems([
+        self.well_root_item,
+        self.well_tops_folder,
+        self.well_logs_folder,
+        self.track_root_item,
+        self.stratigraphy_root_item,
+    ])
+
+    self.well_tree.blockSignals(False)
+    self.well_tree.setUpdatesEnabled(True)
+    # connect only after the initial items exist -> no itemChanged calls while building
+    self.well_tree.itemChanged.connect(self._on_well_tree_item_changed)
+    # track -> log leaves are created on first expand (set_lazy_children)
+    self.well_tree.itemExpanded.connect(fetch_lazy_children)
 
     self.well_tree.hide()
 
@@ -214,15 +193,7 @@ def build_stratigraphic_column_tree(tree_widget, strat_data):
         if root.child(i).text(0) == "Stratigraphic column":
             root.removeChild(root.child(i))
 
-    root_item = QTreeWidgetItem(["Stratigraphic column"])
-    root_item.setFlags(
-        root_item.flags()
-        | Qt.ItemIsUserCheckable
-        | Qt.ItemIsAutoTristate
-        | Qt.ItemIsSelectable
-        | Qt.ItemIsEnabled
-    )
-    root_item.setCheckState(0, Qt.Unchecked)
+    root_item = _make_folder_item("Stratigraphic column")
     tree_widget.addTopLevelItem(root_item)
 
     # Normalize input
@@ -254,6 +225,10 @@ def build_stratigraphic_column_tree(tree_widget, strat_data):
             parts.append(f"Age (Ma): {a_from} … {a_to}")
         return " | ".join(parts)
 
+    # enum lookups hoisted out of the per-node loop
+    user_role = Qt.UserRole
+    auto_tristate = Qt.ItemIsAutoTristate
+
     def add_children(parent_item, node_list, depth, max_depth=7):
         if depth > max_depth:
             return
@@ -264,7 +239,7 @@ def build_stratigraphic_column_tree(tree_widget, strat_data):
             #item.setCheckState(0, Qt.Checked)
 
             # store full record
-            item.setData(0, Qt.UserRole, ("strat_node", node))
+            item.setData(0, user_role, ("strat_node", node))
 
             # tooltip / secondary info
             item.setToolTip(0, node_tooltip(node))
@@ -274,7 +249,7 @@ def build_stratigraphic_column_tree(tree_widget, strat_data):
             members = node.get("members") or []
             if isinstance(members, list) and members and depth < max_depth:
                 # make parents tristate for easy toggling
-                item.setFlags(item.flags() | Qt.ItemIsAutoTristate)
+                item.setFlags(item.flags() | auto_tristate)
                 add_children(item, members, depth + 1, max_depth=max_depth)
 
     add_children(root_item, nodes, depth=1, max_depth=7)
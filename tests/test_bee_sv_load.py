@@ -0,0 +1,32 @@
+import pandas as pd
+
+from pywellsection.Bee_SV_load import StratigraphyModel
+
+
+def _ats_frame():
+    return pd.DataFrame({
+        "KUERZEL": ["ROOT", "A", "B", ""],
+        "BEDEUTUNG": ["Root", "Unit A", None, "no code"],
+        "Vater": [None, "ROOT", "ROOT", "ROOT"],
+        "Level": [1, 2, 2, 2],
+        "Alter von": [100, 50, 80, 1],
+        "Alter bis": [0, 0, 50, 0],
+        "Strat_Typ": ["CH", None, "CH", ""],
+    })
+
+
+def test_clean_str_col_returns_none_for_blank_cells():
+    col = pd.Series(["  A ", "", "   ", None, float("nan"), 5])
+    assert StratigraphyModel._clean_str_col(col) == ["A", None, None, None, None, "5"]
+
+
+def test_build_tree_with_blank_cells():
+    tree = StratigraphyModel().build_from_dataframe(_ats_frame())
+
+    roots = tree["stratigraphy"]
+    assert [r["acronym"] for r in roots] == ["ROOT"]
+    # members youngest -> oldest, the row without KUERZEL is skipped
+    members = roots[0]["members"]
+    assert [m["acronym"] for m in members] == ["A", "B"]
+    assert members[0]["strat_type"] is None
+    assert members[1]["name"] is None